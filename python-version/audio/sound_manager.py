@@ -2,141 +2,288 @@
 
 Separated for modular architecture. Safe to import standalone.
 """
-from typing import List
-import math
-import random
+import hashlib
+import os
+import threading
+import wave
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - sounds fall back to silence
+    np = None  # type: ignore
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - optional accelerator
+    ne = None  # type: ignore
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None  # type: ignore
 try:
     import pygame
 except Exception:  # pragma: no cover - allow import in non-pygame envs
     pygame = None  # type: ignore
 
+# Bump whenever a generator changes so stale cached WAV files are ignored
+SOUND_CACHE_VERSION = 1
+
+# Full-length explosion that shorter word-explosion variants are sliced from
+EXPLOSION_DURATION = 250
+
+
+# One-cycle sine table (power-of-two length so indices wrap with a mask)
+_SIN_LUT_SIZE = 4096
+_SIN_LUT = (np.sin(2 * np.pi * np.arange(_SIN_LUT_SIZE) / _SIN_LUT_SIZE).astype(np.float32)
+            if np is not None else None)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _rumble_kernel(samples, sample_rate, freqs, blast_samples, lut):  # pragma: no cover - compiled
+        """Enveloped low-frequency rumble with a fresh random phase per sample"""
+        out = np.empty(samples, dtype=np.float32)
+        size = lut.size
+        for i in range(samples):
+            rumble = 0.0
+            for freq in freqs:
+                idx = int(freq * i * size / sample_rate) + np.random.randint(0, size)
+                rumble += lut[idx & (size - 1)] * 5000
+            if i < blast_samples:
+                env = i / blast_samples * 0.5
+            else:
+                env = 0.5 * np.exp(-3 * (i - blast_samples) / (samples - blast_samples))
+            out[i] = rumble * env
+        return out
+else:
+    _rumble_kernel = None
+
 
 class SoundManager:
     """Simple sound effects manager using pygame's built-in sound generation"""
+
+    # Sounds shared by every instance, keyed by (mixer format, cache version)
+    _shared: Dict[Tuple, Dict[str, 'pygame.mixer.Sound']] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, volume: float = 0.8):
         self.volume = volume
         self.sounds = {}
-        self.generate_sounds()
-    
+        self._generators = self.sound_generators()
+        self._explosion_cache: Dict[int, 'np.ndarray'] = {}
+        # Reused for the stereo fan-out; make_sound copies out of it
+        self._staging: Optional['np.ndarray'] = None
+        # Synthesis runs off the main thread; play() stays silent until it is done
+        self._ready = threading.Event()
+        if pygame is None:
+            self._ready.set()
+        else:
+            threading.Thread(target=self._generate_in_background, daemon=True).start()
+
+    def sound_generators(self) -> Dict[str, Callable[[], 'pygame.mixer.Sound']]:
+        """Map each sound name to the callable that synthesizes it"""
+        return {
+            # Type sound - pew-pew laser shooting sound
+            'type': self.create_pew_sound,
+            # Correct word - dramatic 180ms explosion when word is destroyed
+            'correct': lambda: self.create_word_explosion_sound(180),
+            # Wrong key - error sound, A3 note, 150ms
+            'wrong': lambda: self.create_beep(220, 150),
+            # Ship destroyed - 250ms explosion
+            'destroy': lambda: self.create_explosion_sound(EXPLOSION_DURATION),
+            # Boss appear - dramatic boss entrance
+            'boss': lambda: self.create_boss_sound(500),
+            # Level complete - victory sound, C-E-G chord
+            'level': lambda: self.create_arpeggio([523, 659, 784], 100),
+            # Collision - impact thud
+            'collision': lambda: self.create_impact_sound(150),
+            # Achievement unlocked - success fanfare
+            'achievement': lambda: self.create_arpeggio([440, 554, 659, 880], 80),
+            # Missile launch - whoosh/rocket launch
+            'missile_launch': lambda: self.create_whoosh_sound(280),
+        }
+
     def generate_sounds(self):
-        """Generate simple sound effects programmatically"""
+        """Generate every sound effect up front instead of on first play"""
         if pygame is None:
             return
+        for name in self._generators:
+            self.get_sound(name)
+
+    def _generate_in_background(self) -> None:
         try:
-            # Generate simple beep/click sounds using pygame's sound arrays
-            # Type sound - pew-pew laser shooting sound
-            self.sounds['type'] = self.create_pew_sound()  # Pew-pew laser sound
-            # Correct word - explosion sound when word is destroyed
-            self.sounds['correct'] = self.create_word_explosion_sound(180)  # Dramatic 180ms explosion
-            # Wrong key - error sound
-            self.sounds['wrong'] = self.create_beep(220, 150)  # A3 note, 150ms
-            # Ship destroyed - explosion
-            self.sounds['destroy'] = self.create_explosion_sound(250)  # 250ms explosion
-            # Boss appear - dramatic sound
-            self.sounds['boss'] = self.create_boss_sound(500)  # Dramatic boss entrance
-            # Level complete - victory sound
-            self.sounds['level'] = self.create_arpeggio([523, 659, 784], 100)  # C-E-G chord
-            # Collision - impact sound
-            self.sounds['collision'] = self.create_impact_sound(150)  # Impact thud
-            # Achievement unlocked
-            self.sounds['achievement'] = self.create_arpeggio([440, 554, 659, 880], 80)  # Success fanfare
-            # Missile launch - whoosh/rocket launch
-            self.sounds['missile_launch'] = self.create_whoosh_sound(280)
-        except Exception:
-            # Create empty sound objects as fallback
-            for key in ['type', 'correct', 'wrong', 'destroy', 'boss', 'level', 'collision', 'achievement', 'missile_launch']:
-                self.sounds[key] = None
+            self.generate_sounds()
+        finally:
+            self._ready.set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until background synthesis has finished"""
+        return self._ready.wait(timeout)
+
+    def get_sound(self, sound_name: str) -> Optional['pygame.mixer.Sound']:
+        """Return a sound, synthesizing it the first time it is requested"""
+        if sound_name not in self.sounds:
+            create = self._generators.get(sound_name)
+            if create is None:
+                return None
+            shared = SoundManager._shared.setdefault(self._shared_key(), {})
+            with SoundManager._shared_lock:
+                if sound_name not in shared:
+                    try:
+                        shared[sound_name] = self._load_or_create(sound_name, create)
+                    except Exception:
+                        # Remember the failure so we don't retry on every play
+                        self.sounds[sound_name] = None
+                        return None
+            self.sounds[sound_name] = shared[sound_name]
+        return self.sounds[sound_name]
+
+    @staticmethod
+    def _shared_key() -> Tuple:
+        return (pygame.mixer.get_init(), SOUND_CACHE_VERSION)
+
+    # --- Disk Cache ---
+
+    def _cache_dir(self) -> Optional[Path]:
+        """Return the WAV cache directory for the current mixer format"""
+        mixer = pygame.mixer.get_init()
+        if mixer is None or abs(mixer[1]) != 16:
+            return None
+        frequency, _, channels = mixer
+        key = f"{SOUND_CACHE_VERSION}-{frequency}-{channels}"
+        digest = hashlib.sha1(key.encode()).hexdigest()[:10]
+        path = Path.home() / ".ptype" / f"sounds_cache_v{digest}"
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        return path
+
+    def _load_or_create(self, name: str, create: Callable[[], 'pygame.mixer.Sound']) -> 'pygame.mixer.Sound':
+        """Load a previously synthesized sound from disk, generating it on a miss"""
+        cache_dir = self._cache_dir()
+        if cache_dir is None:
+            return create()
+        path = cache_dir / f"{name}.wav"
+        if path.exists():
+            try:
+                return pygame.mixer.Sound(file=str(path))
+            except pygame.error:
+                pass
+        sound = create()
+        self._write_wav(path, sound)
+        return sound
+
+    def _write_wav(self, path: Path, sound: 'pygame.mixer.Sound') -> None:
+        frequency, _, channels = pygame.mixer.get_init()
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with wave.open(str(tmp_path), 'wb') as handle:
+                handle.setnchannels(channels)
+                handle.setsampwidth(2)
+                handle.setframerate(frequency)
+                handle.writeframes(sound.get_raw())
+            os.replace(tmp_path, path)
+        except (IOError, OSError, wave.Error):
+            pass
 
     # --- Sound Generators ---
 
+    def _silence(self, duration: int) -> 'pygame.mixer.Sound':
+        """Silent placeholder with the same length as the sound it stands in for"""
+        mixer = pygame.mixer.get_init()
+        frequency, channels = (mixer[0], mixer[2]) if mixer else (22050, 2)
+        return pygame.mixer.Sound(buffer=bytes(int(frequency * duration / 1000) * channels * 2))
+
+    def _to_sound(self, mono: 'np.ndarray') -> 'pygame.mixer.Sound':
+        """Wrap a mono int16 buffer, fanning it out to the mixer's channel count"""
+        mixer = pygame.mixer.get_init()
+        channels = mixer[2] if mixer else 2
+        if channels == 1:
+            return pygame.sndarray.make_sound(mono)
+        samples = len(mono)
+        staging = self._staging
+        if staging is None or staging.shape[0] < samples or staging.shape[1] != channels:
+            staging = np.empty((max(samples, 22050), channels), dtype=np.int16)
+            self._staging = staging
+        frames = staging[:samples]
+        frames[:] = mono[:, None]
+        return pygame.sndarray.make_sound(frames)
+
     def create_explosion_sound(self, duration: int) -> 'pygame.mixer.Sound':
-        try:
-            import numpy as np
-            sample_rate = 22050
-            samples = int(sample_rate * duration / 1000)
-            waves = []
-            for _ in range(samples):
-                waves.append([0, 0])
-            blast_samples = int(samples * 0.15)
-            for i in range(blast_samples):
-                import numpy as np
-                blast_envelope = 1.0 - (i / blast_samples) * 0.7
-                noise = np.random.randint(-20000, 20000)
-                waves[i][0] = int(noise * blast_envelope)
-                waves[i][1] = int(noise * blast_envelope)
-            for i in range(samples):
-                t = float(i) / sample_rate
-                rumble = 0
-                for freq in [25, 35, 45, 55]:
-                    import numpy as np
-                    phase = np.random.random() * 2 * np.pi
-                    rumble += math.sin(2 * math.pi * freq * t + phase) * 5000
-                if i < blast_samples:
-                    rumble_env = i / blast_samples * 0.5
-                else:
-                    decay_pos = (i - blast_samples) / (samples - blast_samples)
-                    rumble_env = 0.5 * math.exp(-3 * decay_pos)
-                waves[i][0] += int(rumble * rumble_env)
-                waves[i][1] += int(rumble * rumble_env)
-            crack_start = int(samples * 0.05)
-            crack_end = int(samples * 0.3)
-            for i in range(crack_start, crack_end):
-                t = float(i) / sample_rate
-                crack_freq = 200 + 100 * math.exp(-(i - crack_start) / (crack_end - crack_start))
-                crack = math.sin(2 * math.pi * crack_freq * t) * 8000
-                crack_env = 1.0 - ((i - crack_start) / (crack_end - crack_start))
-                waves[i][0] += int(crack * crack_env)
-                waves[i][1] += int(crack * crack_env)
-            import numpy as np
-            sound_array = np.array(waves, dtype=np.int16)
-            return pygame.sndarray.make_sound(sound_array)
-        except ImportError:
-            return pygame.mixer.Sound(buffer=bytes(100))
+        if np is None:
+            return self._silence(duration)
+        return self._to_sound(self._explosion_samples(duration))
+
+    def _explosion_samples(self, duration: int) -> 'np.ndarray':
+        """Synthesize (once per duration) the mono int16 explosion buffer"""
+        if duration in self._explosion_cache:
+            return self._explosion_cache[duration]
+        sample_rate = 22050
+        samples = int(sample_rate * duration / 1000)
+        rng = np.random.default_rng()
+        i = np.arange(samples, dtype=np.float32)
+        t = i / sample_rate
+        mono = np.zeros(samples, dtype=np.float32)
+        blast_samples = int(samples * 0.15)
+        blast_envelope = 1.0 - (i[:blast_samples] / blast_samples) * 0.7
+        mono[:blast_samples] = rng.integers(-20000, 20000, blast_samples) * blast_envelope
+        freqs = np.array([25, 35, 45, 55], dtype=np.float32)
+        if _rumble_kernel is not None:
+            mono += _rumble_kernel(samples, sample_rate, freqs, blast_samples, _SIN_LUT)
+        else:
+            phases = rng.random((len(freqs), samples), dtype=np.float32) * 2 * np.pi
+            rumble = np.sin(2 * np.pi * np.outer(freqs, t) + phases).sum(axis=0) * 5000
+            rumble_env = np.where(
+                i < blast_samples,
+                i / blast_samples * 0.5,
+                0.5 * np.exp(-3 * (i - blast_samples) / (samples - blast_samples)),
+            )
+            rumble *= rumble_env
+            mono += rumble
+        crack_start = int(samples * 0.05)
+        crack_end = int(samples * 0.3)
+        crack_pos = (i[crack_start:crack_end] - crack_start) / (crack_end - crack_start)
+        crack_freq = 200 + 100 * np.exp(-crack_pos)
+        crack = np.sin(2 * np.pi * crack_freq * t[crack_start:crack_end]) * 8000
+        crack *= 1.0 - crack_pos
+        mono[crack_start:crack_end] += crack
+        mono = np.clip(mono, -32767, 32767).astype(np.int16)
+        self._explosion_cache[duration] = mono
+        return mono
 
     def create_boss_sound(self, duration: int) -> 'pygame.mixer.Sound':
-        try:
-            import numpy as np
-            sample_rate = 22050
-            samples = int(sample_rate * duration / 1000)
-            waves: List[List[int]] = []
-            for i in range(samples):
-                t = float(i) / sample_rate
-                base = math.sin(2 * math.pi * 110 * t)
-                over = 0.4 * math.sin(2 * math.pi * 220 * t)
-                sub = 0.3 * math.sin(2 * math.pi * 55 * t)
-                value = int(12000 * (base + over + sub))
-                envelope = math.exp(-3 * (i - samples * 0.02) / samples)
-                value = int(value * envelope)
-                value = max(-32767, min(32767, value))
-                waves.append([value, value])
-            import numpy as np
-            sound_array = np.array(waves, dtype=np.int16)
-            return pygame.sndarray.make_sound(sound_array)
-        except ImportError:
-            return pygame.mixer.Sound(buffer=bytes(100))
+        if np is None:
+            return self._silence(duration)
+        sample_rate = 22050
+        samples = int(sample_rate * duration / 1000)
+        i = np.arange(samples, dtype=np.float32)
+        t = i / sample_rate
+        w1, w2, w3 = (np.float32(2 * np.pi * freq) for freq in (110, 220, 55))
+        if ne is not None:
+            # Fused single pass over the sample buffer
+            tone = ne.evaluate("12000 * (sin(w1 * t) + 0.4 * sin(w2 * t) + 0.3 * sin(w3 * t))")
+        else:
+            tone = 12000 * (np.sin(w1 * t) + 0.4 * np.sin(w2 * t) + 0.3 * np.sin(w3 * t))
+        envelope = np.exp(-3 * (i - samples * 0.02) / samples)
+        mono = np.clip(tone * envelope, -32767, 32767).astype(np.int16)
+        return self._to_sound(mono)
 
     def create_sweep(self, start_freq: int, end_freq: int, duration: int) -> 'pygame.mixer.Sound':
-        try:
-            import numpy as np
-            sample_rate = 22050
-            samples = int(sample_rate * duration / 1000)
-            waves = []
-            for i in range(samples):
-                t = float(i) / sample_rate
-                progress = i / samples
-                freq = start_freq * (1 - progress) + end_freq * progress
-                noise = random.uniform(-0.1, 0.1)
-                value = int(20000 * (math.sin(2 * math.pi * freq * t) + noise * 0.3))
-                envelope = math.exp(-5 * progress)
-                value = int(value * envelope)
-                if abs(value) > 16000:
-                    value = 16000 if value > 0 else -16000
-                waves.append([value, value])
-            import numpy as np
-            sound_array = np.array(waves, dtype=np.int16)
-            return pygame.sndarray.make_sound(sound_array)
-        except ImportError:
-            return self.create_sweep(start_freq, end_freq, duration)
+        if np is None:
+            return self._silence(duration)
+        sample_rate = 22050
+        samples = int(sample_rate * duration / 1000)
+        rng = np.random.default_rng()
+        i = np.arange(samples, dtype=np.float32)
+        t = i / sample_rate
+        progress = i / samples
+        freq = start_freq * (1 - progress) + end_freq * progress
+        noise = rng.random(samples, dtype=np.float32) * 0.2 - 0.1
+        tone = 20000 * (np.sin(2 * np.pi * freq * t) + noise * 0.3)
+        envelope = np.exp(-5 * progress)
+        mono = np.clip(tone * envelope, -16000, 16000).astype(np.int16)
+        return self._to_sound(mono)
 
     def set_volume(self, volume: float):
         self.volume = max(0.0, min(1.0, volume))
@@ -144,126 +291,109 @@ class SoundManager:
     def play(self, sound_name: str):
         if pygame is None:
             return
-        if self.volume > 0 and sound_name in self.sounds and self.sounds[sound_name]:
+        if self.volume <= 0 or not self._ready.is_set():
+            return
+        sound = self.get_sound(sound_name)
+        if sound:
             try:
-                self.sounds[sound_name].set_volume(self.volume)
-                self.sounds[sound_name].play()
+                sound.set_volume(self.volume)
+                sound.play()
             except Exception:
                 pass
 
     def create_pew_sound(self) -> 'pygame.mixer.Sound':
-        try:
-            import numpy as np
-            sample_rate = 22050
-            duration = 150
-            samples = int(sample_rate * duration / 1000)
-            waves = [0.0] * samples
-            for i in range(samples):
-                t = float(i) / sample_rate
-                progress = i / samples
-                freq = 1200 * ((1 - progress) ** 3) + 100
-                wave = math.sin(2 * math.pi * freq * t)
-                wave += 0.3 * math.sin(2 * math.pi * freq * 1.5 * t)
-                if progress < 0.01:
-                    amplitude = progress / 0.01
-                elif progress < 0.3:
-                    amplitude = 1.0
-                else:
-                    amplitude = (1 - progress) / 0.7
-                waves[i] = wave * amplitude * 16000
-            stereo_waves = [[int(w), int(w)] for w in waves]
-            import numpy as np
-            stereo = np.array(stereo_waves, dtype=np.int16)
-            return pygame.sndarray.make_sound(stereo)
-        except ImportError:
-            return self.create_sweep(1200, 100, 150)
+        if np is None:
+            return self._silence(150)
+        sample_rate = 22050
+        duration = 150
+        samples = int(sample_rate * duration / 1000)
+        i = np.arange(samples, dtype=np.float32)
+        t = i / sample_rate
+        progress = i / samples
+        freq = 1200 * ((1 - progress) ** 3) + 100
+        tone = np.sin(2 * np.pi * freq * t) + 0.3 * np.sin(2 * np.pi * freq * 1.5 * t)
+        amplitude = np.select(
+            [progress < 0.01, progress < 0.3],
+            [progress / 0.01, np.float32(1.0)],
+            (1 - progress) / 0.7,
+        )
+        mono = (tone * amplitude * 16000).astype(np.int16)
+        return self._to_sound(mono)
 
     def create_laser(self, start_freq: int, end_freq: int, duration: int) -> 'pygame.mixer.Sound':
         return self.create_sweep(start_freq, end_freq, duration)
 
     def create_arpeggio(self, frequencies: List[int], note_duration: int) -> 'pygame.mixer.Sound':
-        try:
-            import numpy as np
-            sample_rate = 22050
-            waves = []
-            for freq in frequencies:
-                samples = int(sample_rate * note_duration / 1000)
-                for i in range(samples):
-                    t = float(i) / sample_rate
-                    value = int(32767 * math.sin(2 * math.pi * freq * t))
-                    envelope = 1.0
-                    if i < samples * 0.1:
-                        envelope = i / (samples * 0.1)
-                    elif i > samples * 0.8:
-                        envelope = (samples - i) / (samples * 0.2)
-                    value = int(value * envelope * 0.7)
-                    waves.append([value, value])
-            import numpy as np
-            sound_array = np.array(waves, dtype=np.int16)
-            return pygame.sndarray.make_sound(sound_array)
-        except ImportError:
-            return pygame.mixer.Sound(buffer=bytes(100))
+        if np is None:
+            return self._silence(note_duration * len(frequencies))
+        sample_rate = 22050
+        samples = int(sample_rate * note_duration / 1000)
+        i = np.arange(samples, dtype=np.float32)
+        t = i / sample_rate
+        envelope = np.select(
+            [i < samples * 0.1, i > samples * 0.8],
+            [i / (samples * 0.1), (samples - i) / (samples * 0.2)],
+            np.float32(1.0),
+        )
+        envelope *= 32767 * 0.7
+        buf = np.empty((len(frequencies), samples), dtype=np.float32)
+        for note, freq in zip(buf, frequencies):
+            np.sin(2 * np.pi * freq * t, out=note)
+            note *= envelope
+        mono = buf.ravel().astype(np.int16)
+        return self._to_sound(mono)
 
     def create_beep(self, frequency: int, duration: int) -> 'pygame.mixer.Sound':
-        try:
-            import numpy as np
-            sample_rate = 22050
-            samples = int(sample_rate * duration / 1000)
-            waves = []
-            for i in range(samples):
-                t = float(i) / sample_rate
-                value = int(12000 * math.sin(2 * math.pi * frequency * t))
-                envelope = math.exp(-3 * (i / samples))
-                waves.append([int(value * envelope), int(value * envelope)])
-            import numpy as np
-            sound_array = np.array(waves, dtype=np.int16)
-            return pygame.sndarray.make_sound(sound_array)
-        except ImportError:
-            return pygame.mixer.Sound(buffer=bytes(100))
+        if np is None:
+            return self._silence(duration)
+        sample_rate = 22050
+        samples = int(sample_rate * duration / 1000)
+        i = np.arange(samples, dtype=np.float32)
+        tone = 12000 * np.sin(2 * np.pi * frequency * i / sample_rate)
+        envelope = np.exp(-3 * (i / samples))
+        mono = (tone * envelope).astype(np.int16)
+        return self._to_sound(mono)
 
     def create_impact_sound(self, duration: int) -> 'pygame.mixer.Sound':
-        try:
-            import numpy as np
-            sample_rate = 22050
-            samples = int(sample_rate * duration / 1000)
-            waves = []
-            for i in range(samples):
-                t = float(i) / sample_rate
-                value = int(20000 * (random.uniform(-1, 1)))
-                envelope = math.exp(-6 * (i / samples))
-                waves.append([int(value * envelope), int(value * envelope)])
-            import numpy as np
-            sound_array = np.array(waves, dtype=np.int16)
-            return pygame.sndarray.make_sound(sound_array)
-        except ImportError:
-            return pygame.mixer.Sound(buffer=bytes(100))
+        if np is None:
+            return self._silence(duration)
+        sample_rate = 22050
+        samples = int(sample_rate * duration / 1000)
+        rng = np.random.default_rng()
+        progress = np.arange(samples, dtype=np.float32) / samples
+        tone = (rng.random(samples, dtype=np.float32) * 2 - 1) * 20000
+        mono = (tone * np.exp(-6 * progress)).astype(np.int16)
+        return self._to_sound(mono)
 
     def create_word_explosion_sound(self, duration: int) -> 'pygame.mixer.Sound':
-        return self.create_explosion_sound(duration)
+        if np is None or duration > EXPLOSION_DURATION:
+            return self.create_explosion_sound(duration)
+        base = self._explosion_samples(EXPLOSION_DURATION)
+        mono = base[:int(22050 * duration / 1000)].copy()
+        # Short fade so the truncated tail doesn't click
+        fade = min(len(mono), int(22050 * 0.005))
+        if fade:
+            tail = mono[len(mono) - fade:]
+            tail[:] = tail * np.linspace(1.0, 0.0, fade, dtype=np.float32)
+        return self._to_sound(mono)
 
     def create_whoosh_sound(self, duration: int = 300) -> 'pygame.mixer.Sound':
-        try:
-            import numpy as np
-            sample_rate = 22050
-            samples = int(sample_rate * duration / 1000)
-            waves = np.zeros((samples, 2), dtype=np.int16)
-            for i in range(samples):
-                t = i / sample_rate
-                p = i / samples
-                noise = (random.random() * 2 - 1) * (0.6 + 0.4 * p)
-                rumble = 0.5 * math.sin(2 * math.pi * (40 + 20 * p) * t)
-                whistle = 0.3 * math.sin(2 * math.pi * (300 + 500 * p) * t)
-                if p < 0.1:
-                    env = p / 0.1
-                elif p > 0.85:
-                    env = max(0.0, (1 - (p - 0.85) / 0.15))
-                else:
-                    env = 1.0
-                val = (noise + rumble + whistle) * env
-                v = int(max(-1.0, min(1.0, val)) * 14000)
-                waves[i, 0] = v
-                waves[i, 1] = v
-            return pygame.sndarray.make_sound(waves)
-        except ImportError:
-            return self.create_sweep(120, 500, duration)
-
+        if np is None:
+            return self._silence(duration)
+        sample_rate = 22050
+        samples = int(sample_rate * duration / 1000)
+        rng = np.random.default_rng()
+        i = np.arange(samples, dtype=np.float32)
+        t = i / sample_rate
+        p = i / samples
+        noise = (rng.random(samples, dtype=np.float32) * 2 - 1) * (0.6 + 0.4 * p)
+        rumble = 0.5 * np.sin(2 * np.pi * (40 + 20 * p) * t)
+        whistle = 0.3 * np.sin(2 * np.pi * (300 + 500 * p) * t)
+        env = np.select(
+            [p < 0.1, p > 0.85],
+            [p / 0.1, np.maximum(0.0, 1 - (p - 0.85) / 0.15)],
+            np.float32(1.0),
+        )
+        val = (noise + rumble + whistle) * env
+        mono = (np.clip(val, -1.0, 1.0) * 14000).astype(np.int16)
+        return self._to_sound(mono)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 
 class Achievement:
     """Achievement definition used for UI display and progress tracking."""
 
+    __slots__ = ("id", "name", "description", "icon", "unlocked", "unlock_date")
+
     def __init__(self, identifier: str, name: str, description: str, icon: str = "🏆"):
         self.id = identifier
         self.name = name
@@ -17,7 +20,7 @@ class Achievement:
         self.unlock_date = None
 
 
-ACHIEVEMENTS: Dict[str, Achievement] = {
+_ACHIEVEMENT_DEFINITIONS: Dict[str, Achievement] = {
     "first_word": Achievement("first_word", "First Steps", "Type your first word", "BABY"),
     "speed_demon": Achievement("speed_demon", "Speed Demon", "Reach 100 WPM", "SPEED"),
     "accuracy_master": Achievement("accuracy_master", "Accuracy Master", "Complete a game with 95% accuracy", "TARGET"),
@@ -39,6 +42,9 @@ ACHIEVEMENTS: Dict[str, Achievement] = {
     "bonus_master": Achievement("bonus_master", "Bonus Master", "Use 25 bonus items in combat", "B25"),
 }
 
+# Read-only view: the registry is fixed at import time
+ACHIEVEMENTS: Mapping[str, Achievement] = MappingProxyType(_ACHIEVEMENT_DEFINITIONS)
+
 
 __all__ = ["Achievement", "ACHIEVEMENTS"]
 
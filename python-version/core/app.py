@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import logging
 import random
+import string
 import sys
+import time
+from functools import cached_property
 from typing import Any, Dict
 
 import pygame
@@ -11,7 +15,7 @@ import pygame
 from pytablericons.tabler_icons import TablerIcons
 
 from audio.sound_manager import SoundManager
-from constants import FPS, MIN_WINDOW_HEIGHT, SCREEN_WIDTH
+from constants import FPS, IDLE_REDRAW_MS, MIN_WINDOW_HEIGHT, RESIZE_DEBOUNCE_MS, SCREEN_WIDTH
 from core.game_state import (
     get_game_state,
     load_game_state,
@@ -30,8 +34,8 @@ from data.trivia_db import TriviaDatabase
 from core.profile_manager import ProfileManager
 from core.settings import GameSettings
 from core.types import GameMode, ProgrammingLanguage
-from effects.effects import LaserBeam, ModernExplosion, Missile, TypingEffect
-from graphics.stars import ModernStar
+from effects.effects import LaserBeam, ModernExplosion, Missile, ObjectPool, TypingEffect
+from graphics.stars import StarField
 from ui import hud as ui_hud
 from ui import screens as ui_screens
 from ui.ui_manager import UIManager
@@ -49,6 +53,72 @@ from gameplay.input_management import (
     trigger_emp,
 )
 
+log = logging.getLogger("ptype.app")
+
+# Event types the game dispatches on; anything else drained from the queue is skipped
+WATCHED_EVENTS = (
+    pygame.QUIT,
+    pygame.VIDEORESIZE,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.WINDOWHIDDEN,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWMINIMIZED,
+    pygame.WINDOWRESTORED,
+)
+
+# Window events after which nothing on screen can be seen, and the ones that undo them
+_WINDOW_HIDDEN_EVENTS = frozenset((pygame.WINDOWHIDDEN, pygame.WINDOWMINIMIZED))
+_WINDOW_SHOWN_EVENTS = frozenset((pygame.WINDOWSHOWN, pygame.WINDOWRESTORED))
+
+# Moving the window to another monitor invalidates the cached desktop height (pygame 2.1.3+)
+WINDOWDISPLAYCHANGED = getattr(pygame, "WINDOWDISPLAYCHANGED", None)
+if WINDOWDISPLAYCHANGED is not None:
+    WATCHED_EVENTS += (WINDOWDISPLAYCHANGED,)
+
+_WATCHED_TYPES = frozenset(WATCHED_EVENTS)
+
+# Everything SDL may queue; TEXTINPUT stays on because KEYDOWN.unicode is built from it
+ALLOWED_EVENTS = WATCHED_EVENTS + (pygame.TEXTINPUT,)
+
+# Every character that appears in the word lists; other keys can never match a word
+_TYPING_CHARS = frozenset(string.ascii_letters + string.digits + string.punctuation + " ")
+
+# Dropdown label -> language, for starting or resuming a programming game
+_LANG_BY_VALUE = {language.value: language for language in ProgrammingLanguage}
+
+# Modes with a live game round: the loop runs update_game() and remembers them for resume
+PLAYING_MODES = frozenset({
+    GameMode.NORMAL,
+    GameMode.PROGRAMMING,
+})
+
+# Modes that animate every frame; all other screens are static and wait on input
+ANIMATED_MODES = frozenset({
+    GameMode.NORMAL,
+    GameMode.PROGRAMMING,
+    GameMode.TRIVIA,
+    GameMode.PAUSE,
+})
+
+# Popup screens whose gradient + starfield backdrop is rendered once and reused
+STATIC_BACKGROUND_MODES = frozenset({
+    GameMode.STATS,
+    GameMode.SETTINGS,
+    GameMode.ABOUT,
+    GameMode.GAME_OVER,
+})
+
+# Entering any of these modes starts the background music
+MUSIC_START_MODES = frozenset({
+    GameMode.MENU,
+    GameMode.NORMAL,
+    GameMode.PROGRAMMING,
+})
+
 
 class PTypeGame:
     """Main P-Type game class with modern design"""
@@ -61,20 +131,14 @@ class PTypeGame:
         except pygame.error:
             pass
 
-        # Initialize TablerIcons
-        self.tabler_icons = TablerIcons()
-
         # Set up window - keep it simple for better compatibility
         self._disable_maximize_later = False  # Don't try to disable maximize
 
         # Create a proper windowed application that starts at screen height
-        try:
-            display_info = pygame.display.Info()
-            screen_height = display_info.current_h
-            calculated_height = screen_height - 80
-            default_height = max(MIN_WINDOW_HEIGHT, calculated_height)
-        except Exception:
-            default_height = max(MIN_WINDOW_HEIGHT, 1000)
+        self._cached_screen_height = None
+        self._max_usable_height = None
+        self._get_screen_height()
+        default_height = max(MIN_WINDOW_HEIGHT, self._max_usable_height)
 
         # Use fixed width - don't calculate proportionally
         window_width = SCREEN_WIDTH
@@ -82,8 +146,13 @@ class PTypeGame:
         flags = pygame.RESIZABLE
         self.screen = pygame.display.set_mode((window_width, default_height), flags)
         pygame.display.set_caption("P-Type - The Typing Game")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS)
+        self._event_filter_mode = None
 
         self.clock = pygame.time.Clock()
+        self._frame_period = 1.0 / FPS
+        self._frame_deadline = time.perf_counter() + self._frame_period
         self.current_height = default_height
         self.is_maximized = False
         self.normal_height = default_height
@@ -92,10 +161,13 @@ class PTypeGame:
         setup_fonts(self)
         self.settings = GameSettings()
         initialize_profile_system(self)
+        if self.current_profile:
+            self.profile_manager.prefetch(self.current_profile)
         setup_sound_system(self)
         setup_window_icon(self)
-        load_background_music(self)
         load_logo_image(self)
+        # Music is decoded on first entry to the menu or gameplay (see run)
+        self._music_loaded = False
 
         # Initialize managers
         self.window_manager = WindowManager(self)
@@ -108,11 +180,17 @@ class PTypeGame:
 
         # Core helpers required by gameplay modules
         self.random = random.Random()
-        self.LaserBeam = LaserBeam
-        self.TypingEffect = TypingEffect
-        self.ModernExplosion = ModernExplosion
-        self.Missile = Missile
-        self.trivia_db = TriviaDatabase()
+        # pygame's tick counter for modules that query via the game object (bound directly, no wrapper frame)
+        self.pygame_time_get_ticks = pygame.time.get_ticks
+        # Effect factories hand out recycled instances; game_updates returns finished ones
+        self.laser_beam_pool = ObjectPool(LaserBeam)
+        self.typing_effect_pool = ObjectPool(TypingEffect)
+        self.explosion_pool = ObjectPool(ModernExplosion)
+        self.missile_pool = ObjectPool(Missile)
+        self.LaserBeam = self.laser_beam_pool.acquire
+        self.TypingEffect = self.typing_effect_pool.acquire
+        self.ModernExplosion = self.explosion_pool.acquire
+        self.Missile = self.missile_pool.acquire
 
         # Preserve profile selected during initialization
         self.current_profile = getattr(self, 'current_profile', None)
@@ -126,36 +204,73 @@ class PTypeGame:
         # Initialize selected mode to "Choose a Mode" by default
         self.selected_mode = "Choose a Mode"
 
-        # If we have a current profile with saves, set selected mode to one with a save
-        if self.current_profile and hasattr(self.current_profile, 'saved_games') and self.current_profile.saved_games:
-            if "normal" in self.current_profile.saved_games:
-                self.selected_mode = "Normal"
-            else:
-                for key in self.current_profile.saved_games.keys():
-                    if key.startswith("programming_"):
-                        lang = key.replace("programming_", "")
-                        self.selected_mode = lang
-                        break
+        # If we have a current profile with saves, set selected mode to the last one saved
+        if self.current_profile and self.current_profile.last_played_mode:
+            self.selected_mode = self.current_profile.last_played_mode
 
         # Save/Load states
         self.saving_game = False
         self.loading_game = False
         self.show_save_slots = False
 
+        # Widgets built by UIManager and mode bookkeeping; None/defaults until first set up
+        self.mode_dropdown = None
+        self.profile_dropdown = None
+        self.profile_panel_rect = None
+        self.select_profile_button = None
+        self.new_profile_button = None
+        self.new_game_button = None
+        self.continue_button = None
+        self._came_from_pause = False
+        self._last_game_mode = GameMode.NORMAL
+
         # Game variables
         reset_game_state(self)
         self.update_spawn_delay()
 
         # Enhanced game objects
-        self.stars = [ModernStar() for _ in range(200)]
+        self.stars = StarField(200)
+        self._static_bg_cache: Dict[GameMode, pygame.Surface] = {}
         self.player_ship = ModernPlayerShip(self.current_height)
 
         # Initialize UI elements for current screen mode
         self.ui_manager.setup_all_ui_elements()
+        self._dirty = True
+
+        # Latest VIDEORESIZE size, applied once the drag goes quiet
+        self._pending_resize = None
+        self._last_resize_ts = 0
+        self._window_visible = True
 
         # For profile select mode, we need additional profile UI setup
         if self.game_mode == GameMode.PROFILE_SELECT:
             self.ui_manager.setup_profile_select_ui()
+
+        # Per-mode draw and event handlers, looked up once per frame/event
+        self._draw_table = {
+            GameMode.PROFILE_SELECT: self.draw_profile_select,
+            GameMode.MENU: self.draw_menu,
+            GameMode.STATS: self.draw_stats_popup,
+            GameMode.SETTINGS: self.draw_settings_popup,
+            GameMode.ABOUT: self.draw_about_popup,
+            GameMode.NORMAL: self.draw_game,
+            GameMode.PROGRAMMING: self.draw_game,
+            GameMode.PAUSE: self.draw_paused_game,
+            GameMode.TRIVIA: self.draw_trivia_round,
+            GameMode.GAME_OVER: self.draw_game_over,
+        }
+        self._event_table = {
+            GameMode.PROFILE_SELECT: self.handle_profile_select_events,
+            GameMode.MENU: self.handle_menu_events,
+            GameMode.STATS: self.handle_popout_events,
+            GameMode.SETTINGS: self.handle_popout_events,
+            GameMode.ABOUT: self.handle_popout_events,
+            GameMode.NORMAL: self.handle_game_events,
+            GameMode.PROGRAMMING: self.handle_game_events,
+            GameMode.PAUSE: self.handle_pause_events,
+            GameMode.TRIVIA: self.handle_trivia_events,
+            GameMode.GAME_OVER: self.handle_game_over_events,
+        }
     
 
     
@@ -163,6 +278,30 @@ class PTypeGame:
     
 
     
+    @cached_property
+    def tabler_icons(self) -> TablerIcons:
+        """Icon renderer, created on first use."""
+        return TablerIcons()
+
+    @cached_property
+    def trivia_db(self) -> TriviaDatabase:
+        """Trivia question source, created the first time a trivia round starts."""
+        return TriviaDatabase()
+
+    def ensure_background_music(self) -> None:
+        """Load and start the background music once the player reaches the menu or a game."""
+        if not self._music_loaded:
+            self._music_loaded = True
+            load_background_music(self)
+    
+    def _rebuild_button_list(self):
+        """Snapshot the buttons run() updates each frame; called after (re)creating them."""
+        buttons = (self.continue_button, self.new_game_button,
+                   self.stats_button, self.settings_button, self.about_button, self.exit_game_button,
+                   self.close_popout_button, self.resume_button, self.quit_to_menu_button, self.quit_game_button,
+                   self.restart_button, self.menu_button)
+        self._updatable_buttons = tuple(button for button in buttons if button)
+
     def recalculate_ui_positions(self):
         """Recalculate UI positions and sizes based on current window dimensions.
         
@@ -201,7 +340,7 @@ class PTypeGame:
                     windll.user32.SetWindowPos(hwnd, 0, 0, 0, 0, 0, 0x0027)
             
         except Exception as e:
-            print(f"Could not disable maximize button: {e}")
+            log.warning("Could not disable maximize button: %s", e)
     
     def handle_window_resize(self, width, height):
         """Handle window resize events - only height changes allowed.
@@ -222,6 +361,7 @@ class PTypeGame:
         # Create resizable window with fixed width
         self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
         self.current_height = new_height
+        self._static_bg_cache.clear()
         
         # Re-disable maximize button after resize
         if self._disable_maximize_later:
@@ -230,21 +370,43 @@ class PTypeGame:
         # Recalculate UI positions for the new dimensions
         self.recalculate_ui_positions()
     
+    def apply_pending_resize(self):
+        """Apply the most recent window resize once no new one has arrived for RESIZE_DEBOUNCE_MS"""
+        if self._pending_resize is None:
+            return
+        if pygame.time.get_ticks() - self._last_resize_ts < RESIZE_DEBOUNCE_MS:
+            return
+        width, height = self._pending_resize
+        self._pending_resize = None
+        self.handle_window_resize(width, height)
+        self._dirty = True
+    
+    def _get_screen_height(self) -> int:
+        """Desktop height, queried once and reused until the window changes display"""
+        if self._cached_screen_height is None:
+            try:
+                if pygame.display.get_surface() is None:
+                    screen_height = pygame.display.Info().current_h
+                else:
+                    # Once a mode is set, Info() reports the window size instead of the desktop
+                    screen_height = max(height for _width, height in pygame.display.get_desktop_sizes())
+            except Exception:
+                # Fallback method for standalone executables
+                try:
+                    import tkinter as tk
+                    root = tk.Tk()
+                    screen_height = root.winfo_screenheight()
+                    root.destroy()
+                except Exception:
+                    screen_height = 1080
+            self._cached_screen_height = screen_height
+            self._max_usable_height = screen_height - 80  # Leave space for taskbar
+        return self._cached_screen_height
+    
     def check_maximize_state(self):
         """Check and handle window maximize state"""
         # Get display info to check if window should be maximized
-        try:
-            display_info = pygame.display.Info()
-            screen_height = display_info.current_h
-        except Exception:
-            # Fallback method for standalone executables
-            try:
-                import tkinter as tk
-                root = tk.Tk()
-                screen_height = root.winfo_screenheight()
-                root.destroy()
-            except Exception:
-                screen_height = 1080
+        screen_height = self._get_screen_height()
         
         # If current height is close to screen height, ensure it's properly sized
         if self.current_height >= screen_height - 100:
@@ -252,18 +414,7 @@ class PTypeGame:
     
     def toggle_maximize(self):
         """Toggle between normal and maximized window states using keyboard shortcut"""
-        try:
-            display_info = pygame.display.Info()
-            screen_height = display_info.current_h
-        except Exception:
-            # Fallback method for standalone executables
-            try:
-                import tkinter as tk
-                root = tk.Tk()
-                screen_height = root.winfo_screenheight()
-                root.destroy()
-            except Exception:
-                screen_height = 1080
+        self._get_screen_height()
         
         if self.is_maximized:
             # Restore to normal size
@@ -272,8 +423,7 @@ class PTypeGame:
         else:
             # Maximize to screen height (but keep width fixed)
             self.is_maximized = True
-            max_height = screen_height - 80  # Leave space for taskbar
-            self.handle_window_resize(SCREEN_WIDTH, max_height)  # Fixed width
+            self.handle_window_resize(SCREEN_WIDTH, self._max_usable_height)  # Fixed width
     
     # Removed old methods - now handled by imported modules
     
@@ -322,53 +472,93 @@ class PTypeGame:
     
     def draw_game_over(self):
         return ui_screens.draw_game_over(self)
+
+    def draw_paused_game(self):
+        self.draw_game()
+        self.draw_pause_menu()
+
+    def draw_trivia_round(self):
+        # Draw game in background with overlay
+        self.draw_game()
+        self.draw_trivia()
+    
+    def draw_static_background(self):
+        """Blit the cached gradient and starfield for popup screens, rendering it on first use"""
+        background = self._static_bg_cache.get(self.game_mode)
+        if background is None:
+            background = pygame.Surface(self.screen.get_size()).convert()
+            ui_screens.draw_modern_background(self, background)
+            self.stars.draw(background)
+            self._static_bg_cache[self.game_mode] = background
+        self.screen.blit(background, (0, 0))
     
     def draw(self):
         """Main draw method"""
-        self.draw_modern_background()
+        if self.game_mode in STATIC_BACKGROUND_MODES:
+            # Gradient and stars come from the per-mode cache
+            self.draw_static_background()
+        else:
+            self.draw_modern_background()
         
-        if self.game_mode == GameMode.PROFILE_SELECT:
-            self.draw_profile_select()
-        elif self.game_mode == GameMode.MENU:
-            self.draw_menu()
-        elif self.game_mode == GameMode.STATS:
-            # Draw stars in background
-            for star in self.stars:
-                star.draw(self.screen)
-            self.draw_stats_popup()
-        elif self.game_mode == GameMode.SETTINGS:
-            # Draw stars in background
-            for star in self.stars:
-                star.draw(self.screen)
-            self.draw_settings_popup()
-        elif self.game_mode == GameMode.ABOUT:
-            # Draw stars in background
-            for star in self.stars:
-                star.draw(self.screen)
-            self.draw_about_popup()
-        elif self.game_mode in [GameMode.NORMAL, GameMode.PROGRAMMING]:
-            self.draw_game()
-        elif self.game_mode == GameMode.PAUSE:
-            self.draw_game()
-            self.draw_pause_menu()
-        elif self.game_mode == GameMode.TRIVIA:
-            # Draw game in background with overlay
-            self.draw_game()
-            self.draw_trivia()
-        elif self.game_mode == GameMode.GAME_OVER:
-            for star in self.stars:
-                star.draw(self.screen)
-            self.draw_game_over()
+        draw_mode = self._draw_table.get(self.game_mode)
+        if draw_mode is not None:
+            draw_mode()
         
         pygame.display.flip()
     
-    def handle_events(self):
+    def update_event_filter(self):
+        """Only let SDL queue mouse wheel events on the menu, where the mode dropdown scrolls"""
+        self._event_filter_mode = self.game_mode
+        if self.game_mode == GameMode.MENU:
+            pygame.event.set_allowed(pygame.MOUSEWHEEL)
+        else:
+            pygame.event.set_blocked(pygame.MOUSEWHEEL)
+
+    def wait_for_next_frame(self):
+        """Hold the loop at FPS: sleep through most of the frame, then spin the last millisecond.
+
+        SDL_Delay-based Clock.tick() can overshoot by several milliseconds on
+        coarse OS timers; sleeping short of the deadline and finishing on
+        perf_counter() keeps frame pacing steady with only ~1 ms of spinning.
+        """
+        remaining = self._frame_deadline - time.perf_counter()
+        if remaining > 0.002:
+            time.sleep(remaining - 0.001)
+        while time.perf_counter() < self._frame_deadline:
+            pass
+
+        now = time.perf_counter()
+        self._frame_deadline += self._frame_period
+        if self._frame_deadline <= now:
+            # Frame ran long (or we idled in event.wait); resync instead of racing to catch up
+            self._frame_deadline = now + self._frame_period
+        self.clock.tick()  # Frame timing bookkeeping only, no delay
+
+    def wait_for_events(self):
+        """Block on static screens until input arrives or the idle redraw interval elapses"""
+        event = pygame.event.wait(IDLE_REDRAW_MS)
+        if event.type == pygame.NOEVENT:
+            # Timer tick keeps the logo pulse and cursor blink moving
+            self._dirty = True
+            event = None
+        # wait() already pumped SDL for this frame
+        self.handle_events(event, pump=False)
+
+    def handle_events(self, first_event=None, pump=True):
         """Handle all game events"""
-        for event in pygame.event.get():
+        # One unfiltered drain; the allow-list keeps the queue to ALLOWED_EVENTS
+        events = pygame.event.get(pump=pump)
+        if first_event is not None:
+            events.insert(0, first_event)
+        for event in events:
+            if event.type not in _WATCHED_TYPES:
+                continue  # TEXTINPUT only feeds KEYDOWN.unicode
+            self._dirty = True
+
             # Allow mouse wheel events only if dropdown is open and can handle them
             wheel_handled = False
             if event.type == pygame.MOUSEWHEEL and self.game_mode == GameMode.MENU:
-                if hasattr(self, 'mode_dropdown') and self.mode_dropdown.is_open:
+                if self.mode_dropdown is not None and self.mode_dropdown.is_open:
                     wheel_handled = self.mode_dropdown.handle_event(event)
             
             # Ignore mouse wheel events that weren't handled by dropdowns
@@ -377,7 +567,7 @@ class PTypeGame:
             # Also ignore scroll-related mouse button events (4 and 5) ONLY if dropdown is not open
             if (event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.MOUSEBUTTONUP) and event.button in (4, 5):
                 # Allow these events if dropdown is open
-                if self.game_mode == GameMode.MENU and hasattr(self, 'mode_dropdown') and self.mode_dropdown.is_open:
+                if self.game_mode == GameMode.MENU and self.mode_dropdown is not None and self.mode_dropdown.is_open:
                     pass  # Don't continue, let the event through
                 else:
                     continue
@@ -387,30 +577,25 @@ class PTypeGame:
                 self.running = False
             
             elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize - maintain portrait proportions
-                self.handle_window_resize(event.w, event.h)
-            
-            elif self.game_mode == GameMode.PROFILE_SELECT:
-                self.handle_profile_select_events(event)
-            
-            elif self.game_mode == GameMode.MENU:
-                self.handle_menu_events(event)
+                # Coalesce resize drags; applied by apply_pending_resize after a quiet period
+                self._pending_resize = (event.w, event.h)
+                self._last_resize_ts = pygame.time.get_ticks()
             
-            elif self.game_mode in [GameMode.STATS, GameMode.SETTINGS, GameMode.ABOUT]:
-                self.handle_popout_events(event)
+            elif event.type == WINDOWDISPLAYCHANGED:
+                self._cached_screen_height = None
             
-            elif self.game_mode in [GameMode.NORMAL, GameMode.PROGRAMMING]:
-                self.handle_game_events(event)
+            elif event.type in _WINDOW_HIDDEN_EVENTS:
+                self._window_visible = False
             
-            elif self.game_mode == GameMode.PAUSE:
-                self.handle_pause_events(event)
+            elif event.type in _WINDOW_SHOWN_EVENTS:
+                self._window_visible = True
             
-            elif self.game_mode == GameMode.TRIVIA:
-                if event.type == pygame.KEYDOWN:
-                    handle_trivia_input(self, event.key)
-            
-            elif self.game_mode == GameMode.GAME_OVER:
-                self.handle_game_over_events(event)
+            else:
+                handle_mode_event = self._event_table.get(self.game_mode)
+                if handle_mode_event is not None:
+                    handle_mode_event(event)
+
+        self.apply_pending_resize()
     
     def handle_profile_select_events(self, event):
         """Handle profile selection screen events"""
@@ -445,12 +630,12 @@ class PTypeGame:
                     self.profile_name_input += event.unicode
         else:
             # Handle dropdown selection
-            if hasattr(self, 'profile_dropdown') and self.profile_dropdown.handle_event(event):
+            if self.profile_dropdown is not None and self.profile_dropdown.handle_event(event):
                 self.selected_profile_name = self.profile_dropdown.get_selected()
 
             # Handle Select button
-            elif hasattr(self, 'select_profile_button') and self.select_profile_button.handle_event(event):
-                if hasattr(self, 'selected_profile_name') and self.selected_profile_name != "(No profiles)":
+            elif self.select_profile_button is not None and self.select_profile_button.handle_event(event):
+                if self.selected_profile_name is not None and self.selected_profile_name != "(No profiles)":
                     # Find and select the profile
                     profile = self.profile_manager.get_profile_by_name(self.selected_profile_name)
                     if profile:
@@ -459,7 +644,7 @@ class PTypeGame:
                         self.game_mode = GameMode.MENU
 
             # Handle New Profile button
-            elif hasattr(self, 'new_profile_button') and self.new_profile_button.handle_event(event):
+            elif self.new_profile_button is not None and self.new_profile_button.handle_event(event):
                 self.creating_profile = True
                 self.profile_name_input = ""
     
@@ -467,7 +652,7 @@ class PTypeGame:
         """Handle menu events"""
         
         # Handle dropdown FIRST when it's open - for ANY event type (scroll, keyboard, mouse)
-        if hasattr(self, 'mode_dropdown') and hasattr(self.mode_dropdown, 'is_open') and self.mode_dropdown.is_open:
+        if self.mode_dropdown is not None and self.mode_dropdown.is_open:
             handled = self.mode_dropdown.handle_event(event)
             if handled:
                 old_mode = self.selected_mode
@@ -510,20 +695,17 @@ class PTypeGame:
                         load_game_state(self, saved_game)
                         self.game_mode = GameMode.PROGRAMMING
                         # Set the correct language
-                        for pl in ProgrammingLanguage:
-                            if pl.value == self.selected_mode:
-                                self.programming_language = pl
-                                break
+                        self.programming_language = _LANG_BY_VALUE.get(self.selected_mode, self.programming_language)
         
         elif self.new_game_button.handle_event(event):
-            print(f"DEBUG: New Game button pressed, selected_mode: {getattr(self, 'selected_mode', 'NONE')}")
+            log.debug("New Game button pressed, selected_mode: %s", self.selected_mode)
             # Only start game if mode is selected
             if self.selected_mode != "Choose a Mode":
-                print(f"DEBUG: Starting game in {self.selected_mode} mode")
+                log.debug("Starting game in %s mode", self.selected_mode)
                 try:
                     # Start new game based on selected mode
                     reset_game_state(self)
-                    print("DEBUG: Game state reset successful")
+                    log.debug("Game state reset successful")
 
                     # Make sure music is playing when game starts
                     if not pygame.mixer.music.get_busy():
@@ -531,26 +713,21 @@ class PTypeGame:
 
                     if self.selected_mode == "Normal":
                         self.game_mode = GameMode.NORMAL
-                        print("DEBUG: Set game mode to NORMAL")
+                        log.debug("Set game mode to NORMAL")
                     else:
                         self.game_mode = GameMode.PROGRAMMING
-                        print(f"DEBUG: Set game mode to PROGRAMMING")
+                        log.debug("Set game mode to PROGRAMMING")
 
                         # Set the programming language
-                        for lang in ProgrammingLanguage:
-                            if lang.value == self.selected_mode:
-                                self.programming_language = lang
-                                print(f"DEBUG: Set programming language to {lang}")
-                                break
-
-                    print("DEBUG: Game start sequence completed successfully")
-
-                except Exception as e:
-                    print(f"ERROR: Failed to start game: {e}")
-                    import traceback
-                    traceback.print_exc()
+                        self.programming_language = _LANG_BY_VALUE.get(self.selected_mode, self.programming_language)
+                        log.debug("Set programming language to %s", self.programming_language)
+
+                    log.debug("Game start sequence completed successfully")
+
+                except Exception:
+                    log.exception("Failed to start game")
             else:
-                print("ERROR: New Game button pressed but no mode selected")
+                log.error("New Game button pressed but no mode selected")
         
         elif self.stats_button.handle_event(event):
             self.game_mode = GameMode.STATS
@@ -575,7 +752,7 @@ class PTypeGame:
         """Handle events for popout screens (stats, settings, about)"""
         if self.close_popout_button.handle_event(event):
             # Return to pause menu if we came from there, otherwise to main menu
-            if hasattr(self, '_came_from_pause') and self._came_from_pause:
+            if self._came_from_pause:
                 self.game_mode = GameMode.PAUSE
                 self._came_from_pause = False
             else:
@@ -583,14 +760,14 @@ class PTypeGame:
         
         elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             # Return to pause menu if we came from there, otherwise to main menu
-            if hasattr(self, '_came_from_pause') and self._came_from_pause:
+            if self._came_from_pause:
                 self.game_mode = GameMode.PAUSE
                 self._came_from_pause = False
             else:
                 self.game_mode = GameMode.MENU
         
         # Handle change player button in stats
-        elif self.game_mode == GameMode.STATS and hasattr(self, 'stats_change_player_btn'):
+        elif self.game_mode == GameMode.STATS and self.stats_change_player_btn is not None:
             if event.type == pygame.MOUSEBUTTONDOWN and self.stats_change_player_btn.collidepoint(event.pos):
                 self.game_mode = GameMode.PROFILE_SELECT
                 self.update_profile_dropdown = True
@@ -600,12 +777,12 @@ class PTypeGame:
             if self.music_slider.handle_event(event):
                 self.settings.music_volume = self.music_slider.val
                 pygame.mixer.music.set_volume(self.music_slider.val)
-                self.settings.save_settings()
+                self.settings.mark_dirty("settings")
             
             elif self.sound_slider.handle_event(event):
                 self.settings.sound_volume = self.sound_slider.val
                 self.sound_manager.set_volume(self.sound_slider.val)
-                self.settings.save_settings()
+                self.settings.mark_dirty("settings")
     
     def handle_game_events(self, event):
         """Handle in-game events"""
@@ -624,23 +801,16 @@ class PTypeGame:
                 select_previous_ship(self)
             elif event.key == pygame.K_RIGHT:
                 select_next_ship(self)
-            elif event.unicode and event.unicode.isprintable():
-                # Allow all printable characters for maximum compatibility
+            elif event.unicode in _TYPING_CHARS:
                 handle_input(self, event.unicode)
     
     def handle_pause_events(self, event):
         """Handle pause menu events"""
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            if hasattr(self, '_last_game_mode'):
-                self.game_mode = self._last_game_mode
-            else:
-                self.game_mode = GameMode.NORMAL
+            self.game_mode = self._last_game_mode
         
         elif self.resume_button.handle_event(event):
-            if hasattr(self, '_last_game_mode'):
-                self.game_mode = self._last_game_mode
-            else:
-                self.game_mode = GameMode.NORMAL
+            self.game_mode = self._last_game_mode
         
         elif self.save_game_button.handle_event(event):
             # Save current game state to profile
@@ -664,11 +834,11 @@ class PTypeGame:
             reset_game_state(self)
 
             # Update selected mode to match what was just played
-            if hasattr(self, 'mode_dropdown'):
+            if self.mode_dropdown is not None:
                 self.selected_mode = played_mode
 
-            # Recalculate UI to update Continue button state
-            self.ui_manager.setup_ui_elements()
+            # Update Continue/New Game state; the menu layout itself is unchanged
+            self.ui_manager.refresh_menu_state()
             self.game_mode = GameMode.MENU
         
         elif self.quit_game_button.handle_event(event):
@@ -679,14 +849,16 @@ class PTypeGame:
     def reset_game_state(self):
         reset_game_state(self)
 
+    def handle_trivia_events(self, event):
+        """Handle answer keys during a trivia round"""
+        if event.type == pygame.KEYDOWN:
+            handle_trivia_input(self, event.key)
+
     def handle_game_over_events(self, event):
         """Handle game over screen events"""
         if self.restart_button.handle_event(event):
             self.reset_game_state()
-            if hasattr(self, '_last_game_mode'):
-                self.game_mode = self._last_game_mode
-            else:
-                self.game_mode = GameMode.NORMAL
+            self.game_mode = self._last_game_mode
         
         elif self.menu_button.handle_event(event):
             self.game_mode = GameMode.MENU
@@ -697,15 +869,16 @@ class PTypeGame:
                 self.game_mode = GameMode.MENU
                 self.reset_game_state()
 
-    def pygame_time_get_ticks(self) -> int:
-        """Expose pygame's tick counter for modules that query via the game object."""
-
-        return pygame.time.get_ticks()
-
     def random_choice(self, items):
         """Return a deterministic random choice using the game's RNG."""
 
-        sequence = list(items)
+        try:
+            # Lists and tuples are indexed in place, without a copy
+            return self.random.choice(items)
+        except TypeError:
+            sequence = tuple(items)
+        except IndexError:
+            raise ValueError("random_choice requires a non-empty sequence") from None
         if not sequence:
             raise ValueError("random_choice requires a non-empty sequence")
         return self.random.choice(sequence)
@@ -752,27 +925,47 @@ class PTypeGame:
         
         while self.running:
             # Store game mode for resume functionality
-            if self.game_mode in [GameMode.NORMAL, GameMode.PROGRAMMING]:
+            if self.game_mode in PLAYING_MODES:
                 self._last_game_mode = self.game_mode
+
+            if not self._music_loaded and self.game_mode in MUSIC_START_MODES:
+                self.ensure_background_music()
+
+            if self.game_mode is not self._event_filter_mode:
+                self.update_event_filter()
             
-            self.handle_events()
+            buttons = self._updatable_buttons
+
+            # Static screens sleep until input arrives; keep polling while a click animation plays
+            if self.game_mode in ANIMATED_MODES or any(button.click_animation for button in buttons):
+                self.handle_events()
+                self._dirty = True
+            else:
+                self.wait_for_events()
+
+            # Snapshots are taken here, between frames, so the writer never sees a half-applied update
+            self.settings.flush_if_due()
+
+            if not self._window_visible:
+                # Minimized or hidden: keep draining events but don't simulate or render
+                time.sleep(0.1)
+                continue
             
             # Update UI elements
-            for button in [self.continue_button, self.new_game_button,
-                          self.stats_button, self.settings_button, self.about_button, self.exit_game_button,
-                          self.close_popout_button, self.resume_button, self.quit_to_menu_button, self.quit_game_button,
-                          self.restart_button, self.menu_button]:
-                if button:  # Check if button exists
-                    button.update()
+            for button in buttons:
+                button.update()
             
             # Update game
-            if self.game_mode in [GameMode.NORMAL, GameMode.PROGRAMMING]:
+            if self.game_mode in PLAYING_MODES:
                 update_game(self)
             
-            self.draw()
-            self.clock.tick(FPS)
+            if self._dirty:
+                self.draw()
+                self._dirty = False
+            self.wait_for_next_frame()
         
         self.settings.save_settings()
+        self.settings.flush()
         pygame.quit()
         sys.exit()
 
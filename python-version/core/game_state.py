@@ -3,97 +3,122 @@ Game state management for P-Type.
 Handles game state initialization, saving, and loading operations.
 """
 import json
-from .types import GameMode, ProgrammingLanguage
-
-
-def reset_game_state(game):
-    """Reset all game state variables"""
-    game.score = 0
-    game.level = 1
-    game.health = 100
-    game.shield_buffer = 0  # Extra shield from boss defeats at full health
-    game.max_health = 100
-    game.missed_ships = 0
-    game.words_destroyed = 0
-    game.enemies = []
-    game.explosions = []
-    game.typing_effects = []  # New: typing visual effects
-    game.laser_beams = []  # Laser beam effects from player to enemy
-    game.missiles = []  # Seeking missiles in flight
-    game.current_input = ""
-    game.active_enemy = None
-    game.last_enemy_spawn = 0
-    game.game_start_time = 0
-    game.collision_detected = False
-    game.wrong_char_flash = 0
-
-    # Initialize sound manager if not already initialized
-    if not hasattr(game, 'sound_manager') and hasattr(game, 'create_sound_manager'):
-        game.sound_manager = game.create_sound_manager(0.8)
+from .types import MODE_STR, GameMode, ProgrammingLanguage
+
+
+# Immutable per-game defaults, applied with a single dict.update()
+_SCALAR_DEFAULTS = {
+    "score": 0,
+    "level": 1,
+    "health": 100,
+    "shield_buffer": 0,  # Extra shield from boss defeats at full health
+    "max_health": 100,
+    "missed_ships": 0,
+    "words_destroyed": 0,
+    "current_input": "",
+    "active_enemy": None,
+    "last_enemy_spawn": 0,
+    "game_start_time": 0,
+    "collision_detected": False,
+    "wrong_char_flash": 0,
 
     # EMP weapon system
-    game.emp_ready = True
-    game.emp_cooldown = 0
-    game.emp_max_cooldown = 600  # 10 seconds at 60 FPS
-    game.emp_radius = 250
-    game.emp_effect_timer = 0
+    "emp_ready": True,
+    "emp_cooldown": 0,
+    "emp_max_cooldown": 600,  # 10 seconds at 60 FPS
+    "emp_radius": 250,
+    "emp_effect_timer": 0,
 
     # Boss system variables
-    game.boss_spawned = False
-    game.boss_defeated = False
-    game.boss_spawn_time = 0
-    game.enemies_defeated_this_level = 0
+    "boss_spawned": False,
+    "boss_defeated": False,
+    "boss_spawn_time": 0,
+    "enemies_defeated_this_level": 0,
 
     # Player stats tracking
-    if hasattr(game, 'create_session_stats'):
-        game.session_stats = game.create_session_stats()
-    else:
-        game.session_stats = getattr(game, 'session_stats', {})
-    game.total_keystrokes = 0
-    game.correct_keystrokes = 0
-    game.current_wpm = 0.0
-    game.peak_wpm = 0.0
-    game.accuracy = 100.0
-    game.perfect_words = 0
-    game.mistakes_this_word = 0
+    "total_keystrokes": 0,
+    "correct_keystrokes": 0,
+    "current_wpm": 0.0,
+    "peak_wpm": 0.0,
+    "accuracy": 100.0,
+    "perfect_words": 0,
+    "mistakes_this_word": 0,
 
     # Name entry state
-    game.entering_name = False
-    game.player_name_input = ""
+    "entering_name": False,
+    "player_name_input": "",
 
     # Profile management state
-    game.creating_profile = False
-    game.selected_profile_name = None
-    game.update_profile_dropdown = False
-    game.stats_change_player_btn = None
-
-    # Achievement notifications
-    game.achievement_notifications = []  # List of (achievement, timer) tuples
+    "creating_profile": False,
+    "selected_profile_name": None,
+    "update_profile_dropdown": False,
+    "stats_change_player_btn": None,
 
     # Trivia system
-    game.total_bosses_defeated = 0  # Track total bosses defeated for trivia trigger
-    game.trivia_pending = False
-    game.current_trivia = None
-    game.selected_answer = -1
-    game.trivia_answered = False
-    game.trivia_result = None  # True for correct, False for wrong
+    "total_bosses_defeated": 0,  # Track total bosses defeated for trivia trigger
+    "trivia_pending": False,
+    "current_trivia": None,
+    "selected_answer": -1,
+    "trivia_answered": False,
+    "trivia_result": None,  # True for correct, False for wrong
 
-    # Bonus items inventory - track quantity of each unique item type
-    game.item_quantities = [0, 0, 0, 0]  # Quantities for each of the 4 unique items
-    game.selected_item_index = 0  # Currently selected item type (0-3)
-    game.active_bonuses = []  # Currently active bonus effects [(item, timer)]
+    "selected_item_index": 0,  # Currently selected item type (0-3)
 
-    game.enemy_spawn_delay = 5200
+    "enemy_spawn_delay": 5200,
+    "_spawn_delay_level": None,
 
     # Bonus effect flags and timers
-    game.rapid_fire_active = False
-    game.rapid_fire_end_time = 0
-    game.rapid_fire_multiplier = 1.0
-    game.multi_shot_active = False
-    game.invincibility_active = False
-    game.time_slow_active = False
-    game.time_slow_end_time = 0
-    game.enemy_slow_factor = 1.0  # Speed multiplier for enemies
+    "rapid_fire_active": False,
+    "rapid_fire_end_time": 0,
+    "rapid_fire_multiplier": 1.0,
+    "multi_shot_active": False,
+    "invincibility_active": False,
+    "time_slow_active": False,
+    "time_slow_end_time": 0,
+    "enemy_slow_factor": 1.0,  # Speed multiplier for enemies
+}
+
+# Mutable defaults; each reset gets fresh containers
+_FACTORY_DEFAULTS = {
+    "enemies": list,
+    "explosions": list,
+    "typing_effects": list,  # Typing visual effects
+    "laser_beams": list,  # Laser beam effects from player to enemy
+    "missiles": list,  # Seeking missiles in flight
+    "achievement_notifications": list,  # List of (achievement, timer) tuples
+    "item_quantities": lambda: [0, 0, 0, 0],  # Quantities for each of the 4 unique bonus items
+    "active_bonuses": list,  # Currently active bonus effects [(item, timer)]
+}
+
+
+# Effect lists whose objects go back to the game's ObjectPools on reset
+_POOLED_LISTS = (
+    ("explosions", "explosion_pool"),
+    ("typing_effects", "typing_effect_pool"),
+    ("laser_beams", "laser_beam_pool"),
+    ("missiles", "missile_pool"),
+)
+
+
+def reset_game_state(game):
+    """Reset all game state variables"""
+    for list_name, pool_name in _POOLED_LISTS:
+        pool = getattr(game, pool_name, None)
+        if pool is not None:
+            pool.release_all(getattr(game, list_name, ()))
+
+    vars(game).update(_SCALAR_DEFAULTS)
+    for name, factory in _FACTORY_DEFAULTS.items():
+        setattr(game, name, factory())
+
+    # Initialize sound manager if not already initialized
+    if not hasattr(game, 'sound_manager') and hasattr(game, 'create_sound_manager'):
+        game.sound_manager = game.create_sound_manager(0.8)
+
+    if hasattr(game, 'create_session_stats'):
+        game.session_stats = game.create_session_stats()
+    else:
+        game.session_stats = getattr(game, 'session_stats', {})
 
 
 def get_game_state(game) -> dict:
@@ -105,7 +130,7 @@ def get_game_state(game) -> dict:
     else:
         actual_mode = current_mode
 
-    mode_value = actual_mode.value if isinstance(actual_mode, GameMode) else str(actual_mode)
+    mode_value = MODE_STR.get(actual_mode, str(actual_mode))
 
     return {
         'score': game.score,
@@ -116,7 +141,7 @@ def get_game_state(game) -> dict:
         'game_mode': mode_value,
         'programming_language': (
             game.programming_language.value
-            if isinstance(actual_mode, GameMode) and actual_mode == GameMode.PROGRAMMING and hasattr(game.programming_language, 'value')
+            if actual_mode is GameMode.PROGRAMMING and hasattr(game.programming_language, 'value')
             else None
         ),
         'boss_spawned': game.boss_spawned,
@@ -156,10 +181,17 @@ def load_game_state(game, state: dict) -> None:
         if hasattr(ProgrammingLanguage, lang.upper()):
             game.programming_language = ProgrammingLanguage[lang.upper()]
 
+    # Spawn rate follows the restored level, not the reset default
+    update_spawn_delay(game)
+
 
 def update_spawn_delay(game):
     """Update enemy spawn delay based on current level"""
+    # The delay depends only on the level; skip the recompute when it hasn't changed
+    if getattr(game, '_spawn_delay_level', None) == game.level:
+        return
     base_delay = 5200
     min_delay = 1800
     delay_reduction = (base_delay - min_delay) * (game.level - 1) / (100 - 1)  # Using MAX_LEVELS from constants
     game.enemy_spawn_delay = max(min_delay, base_delay - delay_reduction)
+    game._spawn_delay_level = game.level
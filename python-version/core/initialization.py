@@ -27,7 +27,8 @@ def load_background_music(game):
 def load_logo_image(game) -> Optional[pygame.Surface]:
     """Load the P-TYPE logo PNG image"""
     logo_path = resource_path('assets/images/ptype_logo.png')
-    game.logo_image = pygame.image.load(logo_path)
+    # Match the display's pixel format once so per-frame blits skip conversion
+    game.logo_image = pygame.image.load(logo_path).convert_alpha()
     # Scale the logo to appropriate size if needed
     logo_width = 400  # Adjust this to desired width
     logo_height = int(game.logo_image.get_height() * (logo_width / game.logo_image.get_width()))
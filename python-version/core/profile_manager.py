@@ -11,9 +11,16 @@ class ProfileManager:
 
     def __init__(self, settings):
         self.settings = settings
+        # load_profiles() result and name index, valid while settings._profiles_version matches
+        self._cached_profiles: Optional[List[PlayerProfile]] = None
+        self._profiles_by_name: Dict[str, PlayerProfile] = {}
+        self._cache_version: Optional[int] = None
 
     def load_profiles(self) -> list:
         """Load profiles from settings"""
+        if self._cached_profiles is not None and self._cache_version == self.settings._profiles_version:
+            return self._cached_profiles
+
         profiles = []
         for name, profile_data in self.settings.profiles.items():
             if isinstance(profile_data, PlayerProfile):
@@ -25,12 +32,16 @@ class ProfileManager:
                     # Update profile attributes from saved data
                     for key, value in profile_data.items():
                         if hasattr(profile, key):
-                            # Special handling for sets (languages_played)
-                            if key == 'languages_played' and isinstance(value, list):
+                            # Special handling for sets (languages_played, achievements)
+                            if key in ('languages_played', 'achievements') and isinstance(value, list):
                                 setattr(profile, key, set(value))
                             else:
                                 setattr(profile, key, value)
                 profiles.append(profile)
+
+        self._cached_profiles = profiles
+        self._profiles_by_name = {profile.name: profile for profile in profiles}
+        self._cache_version = self.settings._profiles_version
         return profiles
 
     def create_profile(self, name: str) -> Optional[PlayerProfile]:
@@ -38,6 +49,7 @@ class ProfileManager:
         if name and name not in self.settings.profiles:
             profile = PlayerProfile(name)
             self.settings.profiles[name] = profile
+            self.settings._profiles_version += 1
             self.settings.save_profiles()
             return profile
         return None
@@ -48,9 +60,23 @@ class ProfileManager:
         self.settings.current_player_name = profile.name
         self.settings.save_settings()
 
+    def prefetch(self, profile: PlayerProfile) -> None:
+        """Warm per-profile data the menu reads on its first frame.
+
+        Profiles written before ``last_played_mode`` existed get it derived once
+        from their saved games, preferring the normal-mode save.
+        """
+        if profile.last_played_mode or not profile.saved_games:
+            return
+        if "normal" in profile.saved_games:
+            profile.last_played_mode = "Normal"
+            return
+        for key in profile.saved_games:
+            if key.startswith("programming_"):
+                profile.last_played_mode = key[len("programming_"):]
+                return
+
     def get_profile_by_name(self, name: str) -> Optional[PlayerProfile]:
         """Get a profile by name"""
-        for profile in self.load_profiles():
-            if profile.name == name:
-                return profile
-        return None
+        self.load_profiles()
+        return self._profiles_by_name.get(name)
@@ -2,12 +2,65 @@
 from __future__ import annotations
 
 import datetime
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from .achievements import ACHIEVEMENTS
 from .types import GameMode
 
-
+# (achievement id, unlock threshold, profile counter), in unlock-notification order
+_SIMPLE_RULES: Tuple[Tuple[str, float, str], ...] = (
+    ("first_word", 1, "total_words_typed"),
+    ("speed_demon", 100, "best_wpm"),
+    ("boss_slayer", 1, "bosses_defeated"),
+    ("level_10", 10, "highest_level"),
+    ("level_20", 20, "highest_level"),
+    ("high_scorer", 10000, "best_score"),
+    ("veteran", 50, "games_played"),
+    ("word_master", 1000, "total_words_typed"),
+    ("trivia_novice", 1, "trivia_questions_correct"),
+    ("trivia_expert", 10, "trivia_questions_correct"),
+    ("trivia_master", 25, "trivia_questions_correct"),
+    ("trivia_genius", 50, "trivia_questions_correct"),
+    ("perfect_trivia", 5, "trivia_streak_best"),
+    ("bonus_collector", 10, "bonus_items_collected"),
+    ("bonus_master", 25, "bonus_items_used"),
+)
+
+# Number of distinct languages for "polyglot", the one counter that is a set
+_POLYGLOT_LANGUAGES = 7
+
+_ALL_ACHIEVEMENT_IDS = frozenset(ACHIEVEMENTS)
+
+_RULE_COUNTERS = frozenset([counter for _, _, counter in _SIMPLE_RULES] + ["languages_played"])
+
+
+def _add_slots(*extra: str) -> Callable[[type], type]:
+    """Rebuild a dataclass with ``__slots__`` (``dataclass(slots=True)`` needs Python 3.10).
+
+    ``extra`` names non-field attributes the instances also carry.
+    """
+    def wrap(cls: type) -> type:
+        field_names = tuple(f.name for f in fields(cls))
+        namespace = dict(cls.__dict__)
+        for name in field_names:
+            namespace.pop(name, None)  # Defaults already live in the generated __init__
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        namespace["__slots__"] = field_names + extra
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+    return wrap
+
+
+@lru_cache(maxsize=64)
+def _mode_key(mode: str, language: Optional[str]) -> str:
+    if mode == 'programming' and language:
+        return f"programming_{language}"
+    return "normal"
+
+
+@_add_slots()
 @dataclass
 class PlayerStats:
     """Statistics captured for a single play session."""
@@ -22,6 +75,7 @@ class PlayerStats:
     perfect_words: int = 0
 
 
+@_add_slots()
 @dataclass
 class HighScoreEntry:
     """Record describing a single high score entry."""
@@ -36,159 +90,145 @@ class HighScoreEntry:
     language: Optional[str] = None
 
 
+def _new_mode_stats() -> Dict[str, Any]:
+    return {
+        'best_wpm': 0.0,
+        'best_score': 0,
+        'highest_level': 0,
+        'bosses_defeated': 0,
+        'games_played': 0,
+        'total_words': 0,
+        'average_accuracy': 0.0,
+    }
+
+
+@_add_slots("_dirty_counters", "_all_achievements_unlocked")
+@dataclass(eq=False)
 class PlayerProfile:
-    """Persistent player profile data and achievement tracking."""
-
-    def __init__(self, name: str = "") -> None:
-        self.name: str = name
-        self.created_at: str = datetime.datetime.now().isoformat() if name else ""
-        self.total_play_time: float = 0.0
-        self.games_played: int = 0
-        self.total_score: int = 0
-        self.total_words_typed: int = 0
-        self.achievements: List[str] = []
-        self.last_played: str = ""
-
-        self.best_score: int = 0
-        self.highest_level: int = 0
-        self.best_wpm: float = 0.0
-        self.bosses_defeated: int = 0
-
-        self.trivia_questions_answered: int = 0
-        self.trivia_questions_correct: int = 0
-        self.trivia_streak_current: int = 0
-        self.trivia_streak_best: int = 0
-        self.bonus_items_collected: int = 0
-        self.bonus_items_used: int = 0
-
-        self.saved_games: Dict[str, Optional[Dict]] = {}
-        self.stats_by_mode: Dict[str, Dict[str, Any]] = {
-            'normal': {
-                'best_wpm': 0.0,
-                'best_score': 0,
-                'highest_level': 0,
-                'bosses_defeated': 0,
-                'games_played': 0,
-                'total_words': 0,
-                'average_accuracy': 0.0,
-            }
-        }
-        self.languages_played: set = set()
-        self.saved_game: Optional[Dict] = None
+    """Persistent player profile data and achievement tracking.
+
+    Only dataclass fields are persisted; underscore attributes set in
+    ``__post_init__`` are runtime bookkeeping.
+    """
+
+    name: str = ""
+    created_at: str = ""
+    total_play_time: float = 0.0
+    games_played: int = 0
+    total_score: int = 0
+    total_words_typed: int = 0
+    achievements: Set[str] = field(default_factory=set)
+    last_played: str = ""
+
+    best_score: int = 0
+    highest_level: int = 0
+    best_wpm: float = 0.0
+    bosses_defeated: int = 0
+
+    trivia_questions_answered: int = 0
+    trivia_questions_correct: int = 0
+    trivia_streak_current: int = 0
+    trivia_streak_best: int = 0
+    bonus_items_collected: int = 0
+    bonus_items_used: int = 0
+
+    saved_games: Dict[str, Optional[Dict]] = field(default_factory=dict)
+    # Menu mode label ("Normal" or a language name) of the most recent save
+    last_played_mode: str = ""
+    stats_by_mode: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {'normal': _new_mode_stats()})
+    languages_played: Set[str] = field(default_factory=set)
+    saved_game: Optional[Dict] = None
+
+    def __post_init__(self) -> None:
+        if self.name and not self.created_at:
+            self.created_at = datetime.datetime.now().isoformat()
+
+        # Counters changed since the last check_achievements(); everything starts
+        # dirty so values restored from disk are evaluated once
+        self._dirty_counters: set = set(_RULE_COUNTERS)
+        # Set by check_achievements once nothing is left to unlock
+        self._all_achievements_unlocked = False
+
+    def bump(self, counter: str, delta: int = 1) -> None:
+        """Increment a lifetime counter and queue its achievements for checking."""
+        setattr(self, counter, getattr(self, counter) + delta)
+        self._dirty_counters.add(counter)
+
+    def record_best(self, counter: str, value: float) -> bool:
+        """Raise a personal-best counter to ``value``; returns True if it improved."""
+        if value <= getattr(self, counter):
+            return False
+        setattr(self, counter, value)
+        self._dirty_counters.add(counter)
+        return True
+
+    def record_language(self, language: str) -> None:
+        self.languages_played.add(language)
+        self._dirty_counters.add("languages_played")
 
     def get_mode_key(self, mode: str, language: Optional[str] = None) -> str:
-        if mode == 'programming' and language:
-            return f"programming_{language}"
-        return "normal"
+        return _mode_key(mode, language)
 
     def get_saved_game(self, mode: str, language: Optional[str] = None) -> Optional[Dict]:
         return self.saved_games.get(self.get_mode_key(mode, language))
 
     def set_saved_game(self, mode: str, game_state: Dict, language: Optional[str] = None) -> None:
-        self.saved_games[self.get_mode_key(mode, language)] = game_state
+        key = self.get_mode_key(mode, language)
+        self.saved_games[key] = game_state
+        self.last_played_mode = "Normal" if key == "normal" else language
 
     def get_mode_stats(self, mode: str, language: Optional[str] = None) -> Dict[str, Any]:
         key = self.get_mode_key(mode, language)
         if key not in self.stats_by_mode:
-            self.stats_by_mode[key] = {
-                'best_wpm': 0.0,
-                'best_score': 0,
-                'highest_level': 0,
-                'bosses_defeated': 0,
-                'games_played': 0,
-                'total_words': 0,
-                'average_accuracy': 0.0,
-            }
+            self.stats_by_mode[key] = _new_mode_stats()
         return self.stats_by_mode[key]
 
     def check_achievements(self, game_state: Dict) -> List[str]:
+        if self._all_achievements_unlocked:
+            return []
         newly_unlocked: List[str] = []
 
-        if "first_word" not in self.achievements and self.total_words_typed > 0:
-            self.achievements.append("first_word")
-            newly_unlocked.append("first_word")
-
-        if "speed_demon" not in self.achievements and self.best_wpm >= 100:
-            self.achievements.append("speed_demon")
-            newly_unlocked.append("speed_demon")
-
-        if "boss_slayer" not in self.achievements and self.bosses_defeated > 0:
-            self.achievements.append("boss_slayer")
-            newly_unlocked.append("boss_slayer")
-
-        if "level_10" not in self.achievements and self.highest_level >= 10:
-            self.achievements.append("level_10")
-            newly_unlocked.append("level_10")
-
-        if "level_20" not in self.achievements and self.highest_level >= 20:
-            self.achievements.append("level_20")
-            newly_unlocked.append("level_20")
-
-        if "high_scorer" not in self.achievements and self.best_score >= 10000:
-            self.achievements.append("high_scorer")
-            newly_unlocked.append("high_scorer")
+        dirty = self._dirty_counters
+        if dirty:
+            self._dirty_counters = set()
+            have = self.achievements
+            for achievement_id, threshold, counter in _SIMPLE_RULES:
+                if counter in dirty and achievement_id not in have and getattr(self, counter) >= threshold:
+                    have.add(achievement_id)
+                    newly_unlocked.append(achievement_id)
 
-        if "veteran" not in self.achievements and self.games_played >= 50:
-            self.achievements.append("veteran")
-            newly_unlocked.append("veteran")
-
-        if "word_master" not in self.achievements and self.total_words_typed >= 1000:
-            self.achievements.append("word_master")
-            newly_unlocked.append("word_master")
-
-        if "polyglot" not in self.achievements and len(self.languages_played) >= 7:
-            self.achievements.append("polyglot")
-            newly_unlocked.append("polyglot")
-
-        if "trivia_novice" not in self.achievements and self.trivia_questions_correct >= 1:
-            self.achievements.append("trivia_novice")
-            newly_unlocked.append("trivia_novice")
-
-        if "trivia_expert" not in self.achievements and self.trivia_questions_correct >= 10:
-            self.achievements.append("trivia_expert")
-            newly_unlocked.append("trivia_expert")
-
-        if "trivia_master" not in self.achievements and self.trivia_questions_correct >= 25:
-            self.achievements.append("trivia_master")
-            newly_unlocked.append("trivia_master")
-
-        if "trivia_genius" not in self.achievements and self.trivia_questions_correct >= 50:
-            self.achievements.append("trivia_genius")
-            newly_unlocked.append("trivia_genius")
-
-        if "perfect_trivia" not in self.achievements and self.trivia_streak_best >= 5:
-            self.achievements.append("perfect_trivia")
-            newly_unlocked.append("perfect_trivia")
-
-        if "bonus_collector" not in self.achievements and self.bonus_items_collected >= 10:
-            self.achievements.append("bonus_collector")
-            newly_unlocked.append("bonus_collector")
-
-        if "bonus_master" not in self.achievements and self.bonus_items_used >= 25:
-            self.achievements.append("bonus_master")
-            newly_unlocked.append("bonus_master")
+            if ("languages_played" in dirty and "polyglot" not in have
+                    and len(self.languages_played) >= _POLYGLOT_LANGUAGES):
+                have.add("polyglot")
+                newly_unlocked.append("polyglot")
 
         if game_state:
             if "accuracy_master" not in self.achievements:
                 accuracy = game_state.get('accuracy', 0)
                 if accuracy >= 95 and game_state.get('game_over', False):
-                    self.achievements.append("accuracy_master")
+                    self.achievements.add("accuracy_master")
                     newly_unlocked.append("accuracy_master")
 
             if "perfect_game" not in self.achievements:
                 perfect_words = game_state.get('perfect_words', 0)
                 if perfect_words >= 10:
-                    self.achievements.append("perfect_game")
+                    self.achievements.add("perfect_game")
                     newly_unlocked.append("perfect_game")
 
             if "marathon" not in self.achievements:
                 play_time = game_state.get('session_time', 0)
                 if play_time >= 1800:
-                    self.achievements.append("marathon")
+                    self.achievements.add("marathon")
                     newly_unlocked.append("marathon")
 
+        self._maybe_seal()
         return newly_unlocked
 
+    def _maybe_seal(self) -> None:
+        """Stop checking achievements once the profile holds every one of them."""
+        if len(self.achievements) >= len(_ALL_ACHIEVEMENT_IDS) and self.achievements >= _ALL_ACHIEVEMENT_IDS:
+            self._all_achievements_unlocked = True
+
 
 __all__ = ["PlayerStats", "HighScoreEntry", "PlayerProfile"]
 
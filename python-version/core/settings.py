@@ -1,14 +1,128 @@
 """Settings and persistence layer for P-Type."""
 from __future__ import annotations
 
+import atexit
+import bisect
+import copy
+import dataclasses
 import datetime
+import itertools
 import json
 import os
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional accelerator
+    ijson = None  # type: ignore
 
 from .profiles import HighScoreEntry, PlayerProfile
-from .types import GameMode
+from .types import MODE_STR, GameMode
+
+# Entries kept per high-score table
+HIGH_SCORE_LIMIT = 10
+
+# Table item: (score, -insertion order, entry), kept in ascending order so the
+# lowest score is first. Among equal scores the older entry ranks higher.
+_ScoreItem = Tuple[int, int, HighScoreEntry]
+
+# Seconds between background flushes of files marked dirty
+SAVE_FLUSH_INTERVAL = 2.0
+
+# Snapshot builder for each kind of file accepted by GameSettings.mark_dirty()
+_SNAPSHOTS = {
+    "settings": "_snapshot_settings",
+    "profiles": "_snapshot_profiles",
+    "scores": "_snapshot_scores",
+}
+
+# One pending file write: (kind, path, data, snapshot number)
+_SaveJob = Tuple[str, Path, Any, int]
+
+# Serializes encoding and writing between the main thread and the writer thread
+_write_lock = threading.Lock()
+# Snapshots are numbered on the main thread, so a higher number is always newer data
+_snapshot_numbers = itertools.count(1)
+# Newest snapshot number written to each path; guarded by _write_lock
+_written_snapshots: Dict[Path, int] = {}
+
+# Parse errors the legacy scores import may raise, for either parser
+_SCORE_IMPORT_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, set):
+        return list(value)
+    if dataclasses.is_dataclass(value):
+        # Same shape orjson gives dataclasses: declared fields only
+        return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Any, path: Path, snapshot: int) -> None:
+    """Write ``data`` as indented JSON, via orjson when it is installed.
+
+    ``snapshot`` is the number the data was taken under; if a newer snapshot of
+    the same file has already been written, this one is dropped.
+    """
+    with _write_lock:
+        if snapshot < _written_snapshots.get(path, 0):
+            return
+        _written_snapshots[path] = snapshot
+        if orjson is not None:
+            raw = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            raw = json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+        path.parent.mkdir(exist_ok=True)
+        # Write beside the target and swap it in, so a crash never leaves a truncated file
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open('wb') as handle:
+            handle.write(raw)
+        os.replace(tmp_path, path)
+
+
+def _score_key(mode: GameMode, language: Optional[str]) -> str:
+    return MODE_STR[mode] + "_" + language if language else MODE_STR[mode]
+
+
+def _entry_from_dict(entry_data: Dict[str, Any]) -> HighScoreEntry:
+    return HighScoreEntry(
+        player_name=entry_data.get('player_name', 'Anonymous'),
+        score=entry_data.get('score', 0),
+        level=entry_data.get('level', 1),
+        wpm=entry_data.get('wpm', 0.0),
+        accuracy=entry_data.get('accuracy', 0.0),
+        timestamp=entry_data.get('timestamp', ''),
+        mode=entry_data.get('mode', 'normal'),
+        language=entry_data.get('language'),
+    )
+
+
+class _LazyScoresDict(dict):
+    """High-score tables by mode key, each read from its shard file on first access."""
+
+    def __init__(self, loader: Callable[[str], List[_ScoreItem]]) -> None:
+        super().__init__()
+        self._loader = loader
+
+    def __missing__(self, key: str) -> List[_ScoreItem]:
+        table = self._loader(key)
+        self[key] = table
+        return table
+
+
+def _load_json(path: Path) -> Any:
+    with path.open('rb') as handle:
+        raw = handle.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 class GameSettings:
@@ -19,75 +133,141 @@ class GameSettings:
         self.save_dir.mkdir(exist_ok=True)
 
         self.settings_file = self.save_dir / "settings.json"
+        # scores.json is the pre-shard format, only read to migrate it
         self.high_scores_file = self.save_dir / "scores.json"
+        self.scores_dir = self.save_dir / "scores"
+        # Written once scores.json has been imported into scores_dir and saved
+        self.scores_migrated_file = self.save_dir / "scores.migrated"
+        self.personal_bests_file = self.save_dir / "personal_bests.json"
         self.profiles_file = self.save_dir / "profiles.json"
         self.saves_file = self.save_dir / "saves.json"
 
         self.current_profile: Optional[PlayerProfile] = None
         self.profiles: Dict[str, PlayerProfile] = {}
+        # Bumped whenever profiles gains or replaces entries; ProfileManager caches against it
+        self._profiles_version = 0
         self.current_player_name = ""
         self.save_slots: List[Optional[Dict]] = [None, None, None]
         self.music_volume = 0.7
         self.sound_volume = 0.8
-        self.high_scores: Dict[str, List[HighScoreEntry]] = {}
+        # Each table is an ascending list of at most HIGH_SCORE_LIMIT items; use _ranked_scores() to read it
+        self.high_scores: Dict[str, List[_ScoreItem]] = _LazyScoresDict(self._load_score_shard)
+        self._dirty_score_keys: set = set()
+        self._score_sequence = itertools.count()
         self.personal_bests: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+        # Files with unsaved changes. The main thread snapshots them (flush_if_due,
+        # flush) and the writer thread only encodes and writes those snapshots.
+        self._dirty: set = set()
+        self._dirty_lock = threading.Lock()
+        self._next_flush = time.monotonic() + SAVE_FLUSH_INTERVAL
+        self._write_queue: "queue.Queue[List[_SaveJob]]" = queue.Queue()
         self.load_all_data()
 
+        threading.Thread(target=self._writer_loop, name="ptype-save-writer", daemon=True).start()
+        atexit.register(self.flush)
+
+    def mark_dirty(self, *kinds: str) -> None:
+        """Schedule "settings", "profiles" and/or "scores" for the next background flush."""
+        with self._dirty_lock:
+            self._dirty.update(kinds)
+
+    def flush_if_due(self) -> None:
+        """Hand snapshots of dirty files to the writer thread; call from the main loop."""
+        now = time.monotonic()
+        if now < self._next_flush:
+            return
+        self._next_flush = now + SAVE_FLUSH_INTERVAL
+        jobs = self._take_snapshots()
+        if jobs:
+            self._write_queue.put(jobs)
+
+    def flush(self) -> None:
+        """Write every file marked dirty, and every queued snapshot, before returning."""
+        while True:
+            try:
+                jobs = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._write_jobs(jobs)
+            self._write_queue.task_done()
+        # Wait out a batch the writer thread has already picked up
+        self._write_queue.join()
+        self._write_jobs(self._take_snapshots())
+
+    def _take_snapshots(self) -> List[_SaveJob]:
+        with self._dirty_lock:
+            pending, self._dirty = self._dirty, set()
+        jobs: List[_SaveJob] = []
+        for kind in pending:
+            jobs.extend(getattr(self, _SNAPSHOTS[kind])())
+        return jobs
+
+    def _write_jobs(self, jobs: List[_SaveJob]) -> bool:
+        """Write each job; returns False if any of them failed."""
+        ok = True
+        for kind, path, data, snapshot in jobs:
+            try:
+                _dump_json(data, path, snapshot)
+            except Exception as exc:
+                ok = False
+                print(f"Could not save {kind}: {exc}")
+                if path.parent == self.scores_dir:
+                    # Keep the table dirty so the next scores save retries it
+                    self._mark_score_keys_dirty((path.stem,))
+        return ok
+
+    def _writer_loop(self) -> None:
+        while True:
+            jobs = self._write_queue.get()
+            try:
+                self._write_jobs(jobs)
+            finally:
+                self._write_queue.task_done()
+
     def load_all_data(self) -> None:
         self.load_settings()
         self.load_profiles()
         self.load_scores()
 
     def save_settings(self) -> None:
+        self._write_jobs(self._snapshot_settings())
+
+    def save_profiles(self) -> None:
+        self._write_jobs(self._snapshot_profiles())
+
+    def _snapshot_settings(self) -> List[_SaveJob]:
         data = {
             "music_volume": self.music_volume,
             "sound_volume": self.sound_volume,
             "current_player": self.current_profile.name if self.current_profile else "",
             "current_player_name": self.current_player_name,
         }
-        try:
-            with self.settings_file.open('w') as handle:
-                json.dump(data, handle, indent=2)
-        except (IOError, OSError) as exc:
-            print(f"Could not save settings: {exc}")
-
-    def save_profiles(self) -> None:
-        payload: Dict[str, Dict] = {}
-        for name, profile in self.profiles.items():
-            if isinstance(profile, PlayerProfile):
-                serialised = {}
-                for key, value in profile.__dict__.items():
-                    if isinstance(value, set):
-                        serialised[key] = list(value)
-                    else:
-                        serialised[key] = value
-                payload[name] = serialised
-            else:
-                payload[name] = profile  # already dict-like
+        return [("settings", self.settings_file, data, next(_snapshot_numbers))]
 
+    def _snapshot_profiles(self) -> List[_SaveJob]:
+        # asdict deep-copies the declared fields, so later gameplay updates
+        # can't reach the writer thread; sets are written as lists
         data = {
-            "profiles": payload,
+            "profiles": {name: dataclasses.asdict(profile) for name, profile in self.profiles.items()},
             "current_player": self.current_profile.name if self.current_profile else "",
         }
-        try:
-            with self.profiles_file.open('w') as handle:
-                json.dump(data, handle, indent=2)
-        except (IOError, OSError) as exc:
-            print(f"Could not save profiles: {exc}")
+        return [("profiles", self.profiles_file, data, next(_snapshot_numbers))]
 
     def save_game(self, game_state: Dict) -> bool:
         if not self.current_profile:
             return False
 
-        game_state['save_time'] = datetime.datetime.now().isoformat()
+        now_iso = datetime.datetime.now().isoformat()
+        game_state['save_time'] = now_iso
         game_state['player_name'] = self.current_profile.name
 
         mode = game_state.get('game_mode', 'normal')
         language = game_state.get('programming_language') if mode == 'programming' else None
 
         self.current_profile.set_saved_game(mode, game_state, language)
-        self.current_profile.last_played = datetime.datetime.now().isoformat()
-        self.save_profiles()
+        self.current_profile.last_played = now_iso
+        self.mark_dirty("profiles")
         return True
 
     def load_game_for_current_profile(self) -> Optional[Dict]:
@@ -98,93 +278,156 @@ class GameSettings:
     def load_settings(self) -> None:
         try:
             if self.settings_file.exists():
-                with self.settings_file.open('r') as handle:
-                    data = json.load(handle)
-                    self.music_volume = max(0.0, min(1.0, data.get("music_volume", 0.7)))
-                    self.sound_volume = max(0.0, min(1.0, data.get("sound_volume", 0.8)))
-                    self.current_player_name = data.get("current_player_name", data.get("current_player", ""))
+                data = _load_json(self.settings_file)
+                self.music_volume = max(0.0, min(1.0, data.get("music_volume", 0.7)))
+                self.sound_volume = max(0.0, min(1.0, data.get("sound_volume", 0.8)))
+                self.current_player_name = data.get("current_player_name", data.get("current_player", ""))
         except (IOError, OSError, json.JSONDecodeError) as exc:
             print(f"Could not load settings: {exc}")
 
     def load_profiles(self) -> None:
         try:
             if self.profiles_file.exists():
-                with self.profiles_file.open('r') as handle:
-                    data = json.load(handle)
-                    profiles_dict = data.get("profiles", data)
-                    self.current_player_name = data.get("current_player", "")
-
-                    for name, profile_data in profiles_dict.items():
-                        profile = PlayerProfile(name)
-                        for key, value in profile_data.items():
-                            if key == 'languages_played' and isinstance(value, list):
-                                setattr(profile, key, set(value))
-                            else:
-                                setattr(profile, key, value)
-                        self.profiles[name] = profile
+                data = _load_json(self.profiles_file)
+                profiles_dict = data.get("profiles", data)
+                self.current_player_name = data.get("current_player", "")
+
+                for name, profile_data in profiles_dict.items():
+                    profile = PlayerProfile(name)
+                    for key, value in profile_data.items():
+                        if not hasattr(profile, key):
+                            continue  # Dropped field from an older save; slotted profiles can't hold it
+                        if key in ('languages_played', 'achievements') and isinstance(value, list):
+                            setattr(profile, key, set(value))
+                        else:
+                            setattr(profile, key, value)
+                    self.profiles[name] = profile
+                self._profiles_version += 1
         except (IOError, OSError, json.JSONDecodeError) as exc:
             print(f"Could not load profiles: {exc}")
 
     def save_scores(self) -> None:
-        serialisable = {
-            key: [
-                {
-                    'player_name': entry.player_name,
-                    'score': entry.score,
-                    'level': entry.level,
-                    'wpm': entry.wpm,
-                    'accuracy': entry.accuracy,
-                    'timestamp': entry.timestamp,
-                    'mode': entry.mode,
-                    'language': entry.language,
-                }
-                for entry in entries
-            ]
-            for key, entries in self.high_scores.items()
-        }
+        """Write personal bests and the high-score shards changed since the last save."""
+        self._write_jobs(self._snapshot_scores())
 
-        data = {
-            "high_scores": serialisable,
-            "personal_bests": self.personal_bests,
-        }
+    def _snapshot_scores(self) -> List[_SaveJob]:
+        with self._dirty_lock:
+            keys, self._dirty_score_keys = self._dirty_score_keys, set()
         try:
-            with self.high_scores_file.open('w') as handle:
-                json.dump(data, handle, indent=2)
-        except (IOError, OSError) as exc:
-            print(f"Could not save scores: {exc}")
+            # Ranked lists are fresh copies; entries are never changed once added
+            jobs: List[_SaveJob] = [
+                ("scores", self._score_shard_path(key), self._ranked_scores(key), next(_snapshot_numbers))
+                for key in keys
+            ]
+            jobs.append(("scores", self.personal_bests_file, copy.deepcopy(self.personal_bests), next(_snapshot_numbers)))
+        except BaseException:
+            self._mark_score_keys_dirty(keys)
+            raise
+        return jobs
+
+    def _mark_score_keys_dirty(self, keys) -> None:
+        with self._dirty_lock:
+            self._dirty_score_keys.update(keys)
 
     def load_scores(self) -> None:
+        """Load personal bests; high-score tables are read lazily per mode."""
+        self.high_scores = _LazyScoresDict(self._load_score_shard)
         try:
-            if self.high_scores_file.exists():
-                with self.high_scores_file.open('r') as handle:
-                    data = json.load(handle)
-                    loaded_scores = data.get("high_scores", {})
-                    self.high_scores = {}
-
-                    for key, value in loaded_scores.items():
-                        if isinstance(value, list):
-                            entries = []
-                            for entry_data in value:
-                                if isinstance(entry_data, dict):
-                                    entries.append(
-                                        HighScoreEntry(
-                                            player_name=entry_data.get('player_name', 'Anonymous'),
-                                            score=entry_data.get('score', 0),
-                                            level=entry_data.get('level', 1),
-                                            wpm=entry_data.get('wpm', 0.0),
-                                            accuracy=entry_data.get('accuracy', 0.0),
-                                            timestamp=entry_data.get('timestamp', ''),
-                                            mode=entry_data.get('mode', 'normal'),
-                                            language=entry_data.get('language'),
-                                        )
-                                    )
-                            self.high_scores[key] = entries
-                        else:
-                            self.high_scores[key] = []
+            if self.personal_bests_file.exists():
+                self.personal_bests = _load_json(self.personal_bests_file)
+        except (IOError, OSError, json.JSONDecodeError) as exc:
+            print(f"Could not load scores: {exc}")
+        # The marker, not scores_dir, records the import: shards can exist from
+        # games played after an import that failed
+        if not self.scores_migrated_file.exists():
+            self._migrate_legacy_scores()
+
+    def _score_shard_path(self, key: str) -> Path:
+        return self.scores_dir / f"{key}.json"
 
-                    self.personal_bests = data.get("personal_bests", {})
+    def _load_score_shard(self, key: str) -> List[_ScoreItem]:
+        table: List[_ScoreItem] = []
+        path = self._score_shard_path(key)
+        try:
+            if path.exists():
+                for entry_data in _load_json(path):
+                    if isinstance(entry_data, dict):
+                        self._push_high_score(table, _entry_from_dict(entry_data))
         except (IOError, OSError, json.JSONDecodeError) as exc:
             print(f"Could not load scores: {exc}")
+        return table
+
+    def _migrate_legacy_scores(self) -> None:
+        """Merge a pre-shard scores.json into the per-mode files (first run after upgrading).
+
+        Legacy entries are merged rather than copied over, so scores saved after
+        an earlier failed attempt survive and a repeated import adds nothing twice.
+        """
+        try:
+            if not self.high_scores_file.exists():
+                self._mark_scores_migrated()
+                return
+            # Tables are staged here and applied only once the whole file has
+            # parsed, so a stream that breaks partway leaves nothing half-imported
+            tables: Dict[str, List[_ScoreItem]] = {}
+            if ijson is not None:
+                # Stream one table at a time rather than decoding the whole file up front
+                with self.high_scores_file.open('rb') as handle:
+                    for key, value in ijson.kvitems(handle, 'high_scores', use_float=True):
+                        tables[key] = self._merge_legacy_table(key, value)
+                    handle.seek(0)
+                    legacy_bests = next(ijson.items(handle, 'personal_bests', use_float=True), {})
+            else:
+                data = _load_json(self.high_scores_file)
+                for key, value in data.get("high_scores", {}).items():
+                    tables[key] = self._merge_legacy_table(key, value)
+                legacy_bests = data.get("personal_bests", {})
+        except (IOError, OSError) + _SCORE_IMPORT_ERRORS as exc:
+            print(f"Could not load scores: {exc}")
+            return
+
+        self.high_scores.update(tables)
+        self._mark_score_keys_dirty(tables)
+        self._merge_legacy_bests(legacy_bests)
+        if self._write_jobs(self._snapshot_scores()):
+            self._mark_scores_migrated()
+
+    def _merge_legacy_table(self, key: str, value: Any) -> List[_ScoreItem]:
+        """Build the table for ``key`` with the legacy entries merged in, without storing it."""
+        # Legacy entries are older, so they go in first and win ties; entries
+        # already in the shard follow, minus any the legacy table repeats
+        table: List[_ScoreItem] = []
+        seen = set()
+        legacy = value if isinstance(value, list) else []
+        current = self._ranked_scores(key)
+        for entry in [_entry_from_dict(data) for data in legacy if isinstance(data, dict)] + current:
+            fields = dataclasses.astuple(entry)
+            if fields not in seen:
+                seen.add(fields)
+                self._push_high_score(table, entry)
+        return table
+
+    def _merge_legacy_bests(self, legacy_bests: Any) -> None:
+        """Fold legacy personal bests in, keeping the higher score per player and mode."""
+        if not isinstance(legacy_bests, dict):
+            return
+        for player, modes in legacy_bests.items():
+            if not isinstance(modes, dict):
+                continue
+            bests = self.personal_bests.setdefault(player, {})
+            for mode_key, record in modes.items():
+                if not isinstance(record, dict):
+                    continue
+                current = bests.get(mode_key)
+                if current is None or record.get("score", 0) > current.get("score", 0):
+                    bests[mode_key] = record
+
+    def _mark_scores_migrated(self) -> None:
+        try:
+            self.scores_migrated_file.touch()
+        except OSError as exc:
+            # Harmless: the next start repeats the merge, which adds nothing twice
+            print(f"Could not record score migration: {exc}")
 
     def add_high_score(
         self,
@@ -202,23 +445,18 @@ class GameSettings:
             wpm=wpm,
             accuracy=accuracy,
             timestamp=datetime.datetime.now().isoformat(),
-            mode=mode.value,
+            mode=MODE_STR[mode],
             language=language,
         )
 
-        key = f"{mode.value}_{language}" if language else mode.value
-        self.high_scores.setdefault(key, []).append(entry)
-        self.high_scores[key].sort(key=lambda item: item.score, reverse=True)
-        self.high_scores[key] = self.high_scores[key][:10]
-
-        position = 0
-        for index, item in enumerate(self.high_scores[key]):
-            if item == entry:
-                position = index + 1
-                break
+        key = _score_key(mode, language)
+        table = self.high_scores[key]
+        position = self._push_high_score(table, entry)
+        if position:
+            self._mark_score_keys_dirty((key,))
 
         self.update_personal_best(mode, score, level, wpm, accuracy, language)
-        self.save_scores()
+        self.mark_dirty("scores")
         return position
 
     def update_personal_best(
@@ -234,7 +472,7 @@ class GameSettings:
             return False
 
         player_key = self.current_profile.name
-        mode_key = f"{mode.value}_{language}" if language else mode.value
+        mode_key = _score_key(mode, language)
         self.personal_bests.setdefault(player_key, {})
         self.personal_bests[player_key].setdefault(mode_key, {
             "score": 0,
@@ -255,8 +493,24 @@ class GameSettings:
         return False
 
     def get_high_scores(self, mode: GameMode, language: Optional[str] = None, limit: int = 10) -> List[HighScoreEntry]:
-        key = f"{mode.value}_{language}" if language else mode.value
-        return self.high_scores.get(key, [])[:limit]
+        key = _score_key(mode, language)
+        return self._ranked_scores(key)[:limit]
+
+    def _push_high_score(self, table: List[_ScoreItem], entry: HighScoreEntry) -> int:
+        """Insert ``entry`` into a table; returns its 1-based rank, or 0 if it didn't place."""
+        item = (entry.score, -next(self._score_sequence), entry)
+        # (score, -order) pairs are unique, so bisect never compares the entries themselves
+        index = bisect.bisect_left(table, item)
+        if len(table) >= HIGH_SCORE_LIMIT:
+            if index == 0:
+                return 0
+            del table[0]
+            index -= 1
+        table.insert(index, item)
+        return len(table) - index
+
+    def _ranked_scores(self, key: str) -> List[HighScoreEntry]:
+        return [item[2] for item in reversed(self.high_scores[key])]
 
 
 __all__ = ["GameSettings"]
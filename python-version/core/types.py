@@ -20,6 +20,10 @@ class GameMode(Enum):
     TRIVIA = "trivia"
 
 
+# GameMode -> value string, for hot paths that build save and score keys
+MODE_STR = {mode: mode.value for mode in GameMode}
+
+
 class ProgrammingLanguage(Enum):
     PYTHON = "Python"
     JAVA = "Java"
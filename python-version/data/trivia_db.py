@@ -21,6 +21,7 @@ from core.types import (
     TriviaQuestion,
     BonusItem,
 )
+from data.yaml_cache import load_yaml
 
 
 class TriviaDatabase:
@@ -43,8 +44,7 @@ class TriviaDatabase:
             cls._trivia_data = {}
             return cls._trivia_data
         
-        with open(trivia_file, 'r', encoding='utf-8') as f:
-            raw_data = yaml.safe_load(f)
+        raw_data = load_yaml(trivia_file)
         
         # Convert YAML format to TriviaQuestion objects
         cls._trivia_data = {}
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import json
 import random
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from core.types import GameMode, ProgrammingLanguage
+from data.yaml_cache import load_yaml
 
 
 try:
@@ -16,6 +18,19 @@ except ImportError:
     print("Warning: PyYAML not found. Install with: pip install PyYAML")
 
 
+def _intern_words(node):
+    """Intern every word in a loaded word file, recursing into nested sections.
+
+    Each word list becomes a tuple with repeated entries dropped (first
+    occurrence kept), so no word is weighted twice by ``random.choice``.
+    """
+    if isinstance(node, dict):
+        return {key: _intern_words(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return tuple(dict.fromkeys(sys.intern(word) if isinstance(word, str) else word for word in node))
+    return node
+
+
 class WordDictionary:
     """Progressive word lists for normal and programming modes."""
 
@@ -56,7 +71,7 @@ class WordDictionary:
     _cache: Dict[str, Dict] = {}
 
     @classmethod
-    def _load_language_data(cls, language) -> Optional[Dict[str, List[str]]]:
+    def _load_language_data(cls, language) -> Optional[Dict[str, Sequence[str]]]:
         """Load language data from external YAML/JSON file if available."""
         if not yaml:
             return None
@@ -71,25 +86,29 @@ class WordDictionary:
         if lang_name == 'normal':
             lang_name = 'normal'
 
+        cached = cls._cache.get(lang_name)
+        if cached is not None:
+            return cached
+
         # Try YAML first, then JSON
         data_dir = Path(__file__).parent
         for ext in ['yaml', 'yml', 'json']:
             file_path = data_dir / f"{lang_name}_words.{ext}"
             if file_path.exists():
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        if ext == 'json':
-                            data = json.load(f)
-                        else:
-                            data = yaml.safe_load(f)
-                        cls._cache[lang_name] = data
-                        return data
+                    if ext == 'json':
+                        data = json.loads(file_path.read_bytes())
+                    else:
+                        data = load_yaml(file_path)
+                    data = _intern_words(data)
+                    cls._cache[lang_name] = data
+                    return data
                 except Exception as e:
                     print(f"Warning: Could not load {file_path}: {e}")
         return None
 
     @classmethod
-    def _get_programming_words(cls, language: ProgrammingLanguage, difficulty: str) -> List[str]:
+    def _get_programming_words(cls, language: ProgrammingLanguage, difficulty: str) -> Sequence[str]:
         """Get words for a specific language and difficulty from external files only."""
         lang_name = language.value.lower()
         if lang_name not in cls._cache:
@@ -116,7 +135,7 @@ class WordDictionary:
         return {'bucket': 'advanced', 'max_length': 999, 'min_length': 10}
 
     @classmethod
-    def _filter_words_by_length(cls, words: List[str], min_length: int, max_length: int) -> List[str]:
+    def _filter_words_by_length(cls, words: Sequence[str], min_length: int, max_length: int) -> List[str]:
         """Filter words to only include those within length constraints."""
         return [word for word in words if min_length <= len(word) <= max_length]
 
@@ -127,31 +146,8 @@ class WordDictionary:
         Only uses external YAML files - no embedded fallbacks remain.
         Returns ('', 1) if no words are available.
         """
-        level_config = cls._get_level_config(level)
-        bucket = level_config['bucket']
-        max_length = level_config['max_length']
-        min_length = level_config['min_length']
-
-        if mode == GameMode.NORMAL:
-            # Load normal words from normal_words.yaml
-            normal_data = cls._load_language_data('normal')  # Direct string approach
-            if normal_data and bucket in normal_data:
-                base_words = normal_data[bucket]
-                filtered_words = cls._filter_words_by_length(base_words, min_length, max_length)
-                words = filtered_words if filtered_words else base_words
-            else:
-                words = []
-        elif mode == GameMode.PROGRAMMING and language:
-            # Load programming words from language-specific YAML
-            external_words = cls._get_programming_words(language, bucket)
-            if external_words:
-                base_words = external_words
-                filtered_words = cls._filter_words_by_length(base_words, min_length, max_length)
-                words = filtered_words if filtered_words else base_words
-            else:
-                words = []
-        else:
-            words = []
+        bucket = cls._get_level_config(level)['bucket']
+        words = cls.get_words(mode, language, level)
 
         if not words:
             return '', 1  # Return empty string if no words available
@@ -188,9 +184,26 @@ class WordDictionary:
 
         return random.choice(words), cls.DIFFICULTY_BUCKETS.get(bucket, 2)
 
+    _words_cache: Dict[tuple, Sequence[str]] = {}
+
+    @classmethod
+    def get_words(cls, mode: GameMode, language: Optional[ProgrammingLanguage] = None, level: int = 1) -> Sequence[str]:
+        """Return word list with progressive difficulty scaling from external YAML files only.
+
+        Enemies spawn many times per level, so each (mode, language, level)
+        list is filtered once and reused; callers must not mutate it.
+        """
+        key = (mode, language, level)
+        words = cls._words_cache.get(key)
+        if words is None:
+            words = cls._select_words(mode, language, level)
+            if words:
+                cls._words_cache[key] = words
+        return words
+
     @classmethod
-    def get_words(cls, mode: GameMode, language: Optional[ProgrammingLanguage] = None, level: int = 1) -> List[str]:
-        """Return word list with progressive difficulty scaling from external YAML files only."""
+    def _select_words(cls, mode: GameMode, language: Optional[ProgrammingLanguage], level: int) -> Sequence[str]:
+        """Pick the level's bucket and apply its word length limits."""
         level_config = cls._get_level_config(level)
         bucket = level_config['bucket']
         max_length = level_config['max_length']
@@ -0,0 +1,52 @@
+"""Cached YAML loading for P-Type's bundled data files.
+
+Parsed files are pickled under ``~/.ptype/cache`` alongside a hash of their
+source bytes, so later runs skip the YAML parse until the file changes.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - callers check for PyYAML themselves
+    yaml = None  # type: ignore
+else:
+    # libyaml's C parser when PyYAML was built with it, pure Python otherwise
+    SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CACHE_DIR = Path.home() / ".ptype" / "cache"
+
+
+def load_yaml(path: Path) -> Any:
+    """Parse ``path`` as YAML, reusing the pickled result while the file is unchanged."""
+    # One read into bytes lets libyaml scan a contiguous buffer
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    cache_path = CACHE_DIR / (path.stem + ".pkl")
+    try:
+        with cache_path.open('rb') as handle:
+            cached_digest, data = pickle.load(handle)
+        if cached_digest == digest:
+            return data
+    except Exception:
+        pass  # Missing, stale or unreadable cache: parse the source instead
+
+    data = yaml.load(raw, Loader=SafeLoader)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and swap it in, so a crash never leaves a truncated file
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with tmp_path.open('wb') as handle:
+            pickle.dump((digest, data), handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # A read-only home only costs the cache, never the data
+    return data
+
+
+__all__ = ["load_yaml"]
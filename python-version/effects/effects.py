@@ -4,6 +4,8 @@ These are extracted to make rendering/effects modular.
 """
 import math
 import random
+
+import numpy as np
 try:
     import pygame
 except Exception:  # pragma: no cover
@@ -20,9 +22,55 @@ except Exception:  # fallback when run as script
         PARTICLE_DRAG, PARTICLE_GRAVITY
     )
 
+_TYPING_PARTICLE_COLORS = (NEON_GREEN, ACCENT_CYAN, MODERN_WHITE)
+
+
+class ObjectPool:
+    """Recycles short-lived effect objects so bursts of effects don't churn the allocator.
+
+    Pooled classes take their constructor arguments again in ``reset()``, and may
+    define ``clear()`` to drop references to other objects while they sit idle.
+    """
+
+    def __init__(self, cls, max_free: int = 64):
+        self._cls = cls
+        self._free = []
+        self._max_free = max_free
+        self._clear = getattr(cls, "clear", None)
+
+    def acquire(self, *args):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            return obj
+        return self._cls(*args)
+
+    def release(self, obj) -> None:
+        if len(self._free) < self._max_free:
+            if self._clear is not None:
+                self._clear(obj)
+            self._free.append(obj)
+
+    def release_all(self, objects) -> None:
+        for obj in objects:
+            self.release(obj)
+
+    def prune(self, objects):
+        """Return the unfinished objects, releasing the finished ones back to the pool."""
+        live = []
+        for obj in objects:
+            if obj.is_finished():
+                self.release(obj)
+            else:
+                live.append(obj)
+        return live
+
 
 class LaserBeam:
     def __init__(self, start_x: int, start_y: int, end_x: int, end_y: int):
+        self.reset(start_x, start_y, end_x, end_y)
+
+    def reset(self, start_x: int, start_y: int, end_x: int, end_y: int):
         self.start_x = start_x
         self.start_y = start_y
         self.end_x = end_x
@@ -39,9 +87,10 @@ class LaserBeam:
         if pygame is None or self.life <= 0:
             return
         alpha = (self.life / self.max_life) ** 0.5
+        randint = random.randint
         for _ in range(3):
-            offset_x = random.randint(-2, 2) * (1 - alpha)
-            offset_y = random.randint(-2, 2) * (1 - alpha)
+            offset_x = randint(-2, 2) * (1 - alpha)
+            offset_y = randint(-2, 2) * (1 - alpha)
             for i in range(4):
                 width = max(1, self.width - i)
                 intensity = alpha * (1 - i * 0.2)
@@ -70,6 +119,9 @@ class LaserBeam:
 
 class TypingEffect:
     def __init__(self, x: int, y: int, char: str, correct: bool = True):
+        self.reset(x, y, char, correct)
+
+    def reset(self, x: int, y: int, char: str, correct: bool = True):
         self.x = x
         self.y = y
         self.char = char
@@ -78,17 +130,21 @@ class TypingEffect:
         self.max_life = 30
         self.particles = []
         if correct:
+            # Bound once: this runs for every correct keystroke
+            uniform, randint, choice = random.uniform, random.randint, random.choice
+            cos, sin = math.cos, math.sin
+            append = self.particles.append
             for _ in range(8):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(2, 5)
-                self.particles.append({
+                angle = uniform(0, 2 * math.pi)
+                speed = uniform(2, 5)
+                append({
                     'x': x,
                     'y': y,
-                    'vx': math.cos(angle) * speed,
-                    'vy': math.sin(angle) * speed - 2,
-                    'life': random.randint(15, 25),
-                    'size': random.randint(1, 3),
-                    'color': random.choice([NEON_GREEN, ACCENT_CYAN, MODERN_WHITE])
+                    'vx': cos(angle) * speed,
+                    'vy': sin(angle) * speed - 2,
+                    'life': randint(15, 25),
+                    'size': randint(1, 3),
+                    'color': choice(_TYPING_PARTICLE_COLORS)
                 })
     
     def update(self):
@@ -121,72 +177,118 @@ class TypingEffect:
         return self.life <= 0 and len(self.particles) == 0
 
 
+# Particle colour schemes for ModernExplosion (indices into its ``kind`` array)
+_FIRE, _SPARK, _SMOKE = 0, 1, 2
+# Per-size explosion settings: (particle count, speed range, particle size range)
+_EXPLOSION_PROFILES = {
+    "large": (40, (3, 15), (3, 8)),
+    "small": (12, (2, 6), (1, 3)),
+    "normal": (25, (3, 12), (2, 6)),
+}
+_EXPLOSION_MAX_LIFE = 70
+# Particle buffer rows: position, velocity, remaining life, size and colour scheme
+_EXPLOSION_FIELDS = 7
+_EXPLOSION_CAPACITY = max(profile[0] for profile in _EXPLOSION_PROFILES.values())
+
+# Generator draws can fill an existing buffer, which the legacy np.random calls can't
+_rng = np.random.default_rng()
+
+
+def _fill_randint(out, low: int, high: int) -> None:
+    """Fill ``out`` in place with whole numbers in [low, high]."""
+    _rng.random(out=out)
+    out *= high - low + 1
+    out += low
+    np.floor(out, out=out)
+
+
 class ModernExplosion:
+    """Burst of particles stepped in bulk.
+
+    Particles live in the first ``count`` columns of a preallocated
+    (field, particle) buffer, so a pooled explosion is refilled in place
+    rather than allocating new arrays.
+    """
+
     def __init__(self, x: int, y: int, size: str = "normal"):
+        self._particles = np.empty((_EXPLOSION_FIELDS, _EXPLOSION_CAPACITY))
+        # Survivors are compacted into the spare buffer, then the two swap
+        self._spare = np.empty_like(self._particles)
+        self._alive = np.empty(_EXPLOSION_CAPACITY, dtype=bool)
+        self.reset(x, y, size)
+
+    def reset(self, x: int, y: int, size: str = "normal"):
         self.x = x
         self.y = y
-        self.particles = []
-        if size == "large":
-            particle_count = 40
-        elif size == "small":
-            particle_count = 12
-        else:
-            particle_count = 25
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            if size == "large":
-                speed = random.uniform(3, 15)
-            elif size == "small":
-                speed = random.uniform(2, 6)
-            else:
-                speed = random.uniform(3, 12)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.randint(50, 70),
-                'max_life': 70,
-                'size': random.randint(3, 8) if size == "large" else (random.randint(1, 3) if size == "small" else random.randint(2, 6)),
-                'color_type': random.choice(['fire', 'spark', 'smoke'])
-            })
-    
+        count, (speed_lo, speed_hi), (size_lo, size_hi) = _EXPLOSION_PROFILES.get(size, _EXPLOSION_PROFILES["normal"])
+        self.count = count
+        px, py, vx, vy, life, sizes, kind = self._particles[:, :count]
+        # The position rows double as scratch space for the launch angle and speed
+        angle, speed = px, py
+        _rng.random(out=angle)
+        angle *= 2 * math.pi
+        _rng.random(out=speed)
+        speed *= speed_hi - speed_lo
+        speed += speed_lo
+        np.cos(angle, out=vx)
+        vx *= speed
+        np.sin(angle, out=vy)
+        vy *= speed
+        px.fill(x)
+        py.fill(y)
+        _fill_randint(life, 50, 70)
+        _fill_randint(sizes, size_lo, size_hi)
+        _fill_randint(kind, 0, 2)
+
     def update(self):
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['life'] -= 1
-            p['vx'] *= PARTICLE_DRAG
-            p['vy'] *= PARTICLE_DRAG
-            p['vy'] += PARTICLE_GRAVITY
-        self.particles = [p for p in self.particles if p['life'] > 0]
-    
+        count = self.count
+        if not count:
+            return
+        px, py, vx, vy, life = self._particles[:5, :count]
+        px += vx
+        py += vy
+        life -= 1
+        vx *= PARTICLE_DRAG
+        vy *= PARTICLE_DRAG
+        vy += PARTICLE_GRAVITY
+        alive = np.greater(life, 0, out=self._alive[:count])
+        survivors = int(np.count_nonzero(alive))
+        if survivors != count:
+            np.compress(alive, self._particles[:, :count], axis=1, out=self._spare[:, :survivors])
+            self._particles, self._spare = self._spare, self._particles
+            self.count = survivors
+
     def draw(self, screen):
-        if pygame is None:
+        if pygame is None or not self.count:
             return
-        for p in self.particles:
-            life_ratio = p['life'] / p['max_life']
-            size = max(1, int(p['size'] * life_ratio))
-            if p['color_type'] == 'fire':
-                if life_ratio > 0.7:
-                    color = (255, 255, int(255 * life_ratio))
-                elif life_ratio > 0.3:
-                    color = (255, int(255 * life_ratio), 0)
-                else:
-                    color = (int(200 * life_ratio), 0, 0)
-            elif p['color_type'] == 'spark':
-                color = (255, 255, int(255 * life_ratio))
-            else:
-                gray = int(100 * life_ratio)
-                color = (gray, gray, gray)
-            pygame.draw.circle(screen, color, (int(p['x']), int(p['y'])), size)
-    
+        px, py, _, _, life, size, kind = self._particles[:, :self.count]
+        life_ratio = life / _EXPLOSION_MAX_LIFE
+        sizes = np.maximum(1, (size * life_ratio).astype(np.int64))
+        fading = (255 * life_ratio).astype(np.int64)
+        gray = (100 * life_ratio).astype(np.int64)
+        fire = kind == _FIRE
+        smoke = kind == _SMOKE
+        hot = life_ratio > 0.7
+        warm = life_ratio > 0.3
+        # Fire cools white-yellow -> orange -> dark red; sparks stay white-yellow; smoke fades grey
+        red = np.where(smoke, gray, np.where(fire & ~warm, (200 * life_ratio).astype(np.int64), 255))
+        green = np.where(smoke, gray, np.where(fire & ~hot, np.where(warm, fading, 0), 255))
+        blue = np.where(smoke, gray, np.where(fire & ~hot, 0, fading))
+        draw_circle = pygame.draw.circle
+        for r, g, b, px, py, radius in zip(red.tolist(), green.tolist(), blue.tolist(),
+                                           px.astype(np.int64).tolist(), py.astype(np.int64).tolist(),
+                                           sizes.tolist()):
+            draw_circle(screen, (r, g, b), (px, py), radius)
+
     def is_finished(self) -> bool:
-        return len(self.particles) == 0
+        return self.count == 0
 
 
 class Missile:
     def __init__(self, start_x: int, start_y: int, target_enemy):
+        self.reset(start_x, start_y, target_enemy)
+
+    def reset(self, start_x: int, start_y: int, target_enemy):
         self.x = float(start_x)
         self.y = float(start_y)
         self.target = target_enemy
@@ -200,6 +302,11 @@ class Missile:
         self.color = ACCENT_ORANGE
         self.core_color = MODERN_WHITE
         self.radius = 5
+
+    def clear(self):
+        # Idle missiles in the pool must not keep destroyed enemies alive
+        self.target = None
+        self.trail = []
     
     def _angle_to(self, tx: float, ty: float) -> float:
         return math.atan2(ty - self.y, tx - self.x)
@@ -255,7 +362,7 @@ class Missile:
                     game.current_input = ""
                     game.mistakes_this_word = 0
                 game.destroy_enemy(self.target)
-            game.explosions.append(ModernExplosion(int(self.x), int(self.y)))
+            game.explosions.append(game.ModernExplosion(int(self.x), int(self.y)))
             self.alive = False
     
     def _add_trail(self):
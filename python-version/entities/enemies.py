@@ -8,7 +8,7 @@ except Exception:  # pragma: no cover
 
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BASE_WPM, MAX_LEVELS, MAX_WPM,
-    NEON_BLUE, NEON_PINK, ACCENT_BLUE, ACCENT_ORANGE, ACCENT_RED, ACCENT_YELLOW, ACCENT_PURPLE,
+    NEON_BLUE, NEON_PINK, NEON_GREEN, DARKER_BG, ACCENT_BLUE, ACCENT_ORANGE, ACCENT_RED, ACCENT_YELLOW, ACCENT_PURPLE,
     MODERN_WHITE, MODERN_GRAY, MODERN_DARK_GRAY
 )
 from graphics.ships import draw_enemy_ship, draw_boss_ship
@@ -65,14 +65,14 @@ class ModernEnemy:
         draw_enemy_ship(screen, int(self.x), int(hover_y), self.width, self.height, base_color, self.active, self.pulse)
 
         remaining_word = self.original_word[len(self.typed_chars):]
-        typed_color = (57, 255, 20)
+        typed_color = NEON_GREEN
         remaining_color = MODERN_WHITE if self.active else MODERN_GRAY
         full_word_surface = font.render(self.original_word, True, MODERN_WHITE)
         word_width = full_word_surface.get_width()
         word_height = full_word_surface.get_height()
         word_bg = pygame.Surface((word_width + 8, word_height + 4))
         word_bg.set_alpha(180)
-        word_bg.fill((4, 6, 12))
+        word_bg.fill(DARKER_BG)
         bg_rect = word_bg.get_rect(center=(self.x, hover_y + self.height + 20))
         screen.blit(word_bg, bg_rect)
         if self.typed_chars:
@@ -142,14 +142,14 @@ class BossEnemy(ModernEnemy):
         base_color = ACCENT_ORANGE
         draw_boss_ship(screen, int(self.x), int(hover_y), self.width, self.height, base_color, self.pulse)
         remaining_word = self.original_word[len(self.typed_chars):]
-        typed_color = (57, 255, 20)
+        typed_color = NEON_GREEN
         remaining_color = ACCENT_YELLOW if self.active else MODERN_WHITE
         full_word_surface = font.render(self.original_word, True, MODERN_WHITE)
         word_width = full_word_surface.get_width()
         word_height = full_word_surface.get_height()
         word_bg = pygame.Surface((word_width + 20, word_height + 8))
         word_bg.set_alpha(200)
-        word_bg.fill((4, 6, 12))
+        word_bg.fill(DARKER_BG)
         pygame.draw.rect(word_bg, ACCENT_ORANGE, word_bg.get_rect(), 2)
         bg_rect = word_bg.get_rect(center=(self.x, hover_y + self.height + 32))
         screen.blit(word_bg, bg_rect)
@@ -10,7 +10,6 @@ from typing import Optional
 
 from core.achievements import ACHIEVEMENTS
 from data.trivia_db import TriviaDatabase
-from effects.effects import Missile
 
 
 def activate_selected_bonus(game) -> Optional[SimpleNamespace]:
@@ -39,7 +38,7 @@ def activate_selected_bonus(game) -> Optional[SimpleNamespace]:
     game.item_quantities[index] -= 1
 
     if getattr(game, "current_profile", None):
-        game.current_profile.bonus_items_used += 1
+        game.current_profile.bump('bonus_items_used')
         newly_unlocked = game.current_profile.check_achievements({})
         for achievement_id in newly_unlocked:
             achievement = ACHIEVEMENTS.get(achievement_id)
@@ -63,7 +62,7 @@ def apply_bonus_effect(game, item) -> bool:
         px, py = int(game.player_ship.x), int(game.player_ship.y)
         playable_enemies.sort(key=lambda enemy: (enemy.x - px) ** 2 + (enemy.y - py) ** 2)
         for enemy in playable_enemies[:5]:
-            game.missiles.append(Missile(px, py, enemy))
+            game.missiles.append(game.Missile(px, py, enemy))
         game.sound_manager.play('missile_launch')
 
     elif name == "Shield Boost":
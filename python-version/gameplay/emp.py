@@ -1,7 +1,6 @@
 """EMP system for P-Type."""
 import math
 
-from effects.effects import ModernExplosion
 
 
 def trigger_emp(game) -> None:
@@ -25,7 +24,7 @@ def trigger_emp(game) -> None:
 
     if enemies_to_destroy:
         for enemy in enemies_to_destroy:
-            game.explosions.append(ModernExplosion(enemy.x, enemy.y))
+            game.explosions.append(game.ModernExplosion(enemy.x, enemy.y))
             if enemy in game.enemies:
                 game.enemies.remove(enemy)
             if enemy is game.active_enemy:
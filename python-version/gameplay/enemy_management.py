@@ -5,7 +5,6 @@ Handles enemy spawning, boss spawning, destruction, and collision detection.
 from constants import SCREEN_WIDTH
 from core.types import GameMode
 from data.word_dictionary import WordDictionary
-from effects.effects import ModernExplosion
 from entities.enemies import BossEnemy, ModernEnemy
 
 
@@ -67,11 +66,11 @@ def destroy_enemy(game, enemy):
             for _ in range(3):
                 offset_x = game.random.randint(-30, 30)
                 offset_y = game.random.randint(-30, 30)
-                game.explosions.append(ModernExplosion(enemy.x + offset_x, enemy.y + offset_y, "large"))
+                game.explosions.append(game.ModernExplosion(enemy.x + offset_x, enemy.y + offset_y, "large"))
             # Play destroy sound for boss
             game.sound_manager.play('destroy')
         else:
-            game.explosions.append(ModernExplosion(enemy.x, enemy.y))
+            game.explosions.append(game.ModernExplosion(enemy.x, enemy.y))
             # Play destroy sound
             game.sound_manager.play('destroy')
 
@@ -87,7 +86,7 @@ def destroy_enemy(game, enemy):
         if hasattr(enemy, 'is_boss') and enemy.is_boss:
             # Update profile boss count
             if game.current_profile:
-                game.current_profile.bosses_defeated += 1
+                game.current_profile.bump('bosses_defeated')
                 mode_stats = game.current_profile.get_mode_stats(
                     game.game_mode.value if hasattr(game.game_mode, 'value') else game.game_mode,
                     game.programming_language.value if hasattr(game.programming_language, 'value') else game.programming_language
@@ -175,9 +174,9 @@ def check_collisions(game) -> bool:
             game.health = max(0, game.health)  # Don't go below 0
 
             # Create explosion effects
-            game.explosions.append(ModernExplosion(enemy.x, enemy.y))
+            game.explosions.append(game.ModernExplosion(enemy.x, enemy.y))
             # Smaller explosion for player damage
-            game.explosions.append(ModernExplosion(game.player_ship.x, game.player_ship.y, "small"))
+            game.explosions.append(game.ModernExplosion(game.player_ship.x, game.player_ship.y, "small"))
 
             # Play collision sound
             game.sound_manager.play('collision')
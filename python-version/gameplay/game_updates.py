@@ -76,24 +76,24 @@ def update_game(game):
     for explosion in game.explosions:
         explosion.update()
 
-    game.explosions = [exp for exp in game.explosions if not exp.is_finished()]
+    game.explosions = game.explosion_pool.prune(game.explosions)
 
     # Update typing effects
     for effect in game.typing_effects:
         effect.update()
 
-    game.typing_effects = [eff for eff in game.typing_effects if not eff.is_finished()]
+    game.typing_effects = game.typing_effect_pool.prune(game.typing_effects)
 
     # Update laser beams
     for laser in game.laser_beams:
         laser.update()
 
-    game.laser_beams = [laser for laser in game.laser_beams if not laser.is_finished()]
+    game.laser_beams = game.laser_beam_pool.prune(game.laser_beams)
 
     # Update missiles (seeking projectiles)
     for missile in game.missiles:
         missile.update(game)
-    game.missiles = [m for m in game.missiles if not m.is_finished()]
+    game.missiles = game.missile_pool.prune(game.missiles)
 
     # Update EMP cooldown
     if game.emp_cooldown > 0:
@@ -131,22 +131,15 @@ def _handle_game_over(game):
     # Update profile stats and check achievements
     if game.current_profile:
         # Update profile stats
-        game.current_profile.games_played += 1
-        game.current_profile.total_score += game.score
-        game.current_profile.total_words_typed += game.words_destroyed
+        game.current_profile.bump('games_played')
+        game.current_profile.bump('total_score', game.score)
+        game.current_profile.bump('total_words_typed', game.words_destroyed)
 
-        if game.score > game.current_profile.best_score:
-            game.current_profile.best_score = game.score
-
-        if game.level > game.current_profile.highest_level:
-            game.current_profile.highest_level = game.level
+        game.current_profile.record_best('best_score', game.score)
+        game.current_profile.record_best('highest_level', game.level)
 
         # Update best WPM if this session's peak was better
-        if game.peak_wpm > game.current_profile.best_wpm:
-            game.current_profile.best_wpm = game.peak_wpm
-            # Save immediately to ensure it persists
-            game.settings.profiles[game.current_profile.name] = game.current_profile
-            game.settings.save_profiles()
+        game.current_profile.record_best('best_wpm', game.peak_wpm)
 
         # Update mode-specific stats
         mode_stats = game.current_profile.get_mode_stats(
@@ -163,7 +156,7 @@ def _handle_game_over(game):
 
         # Track language for polyglot achievement
         if actual_game_mode == GameMode.PROGRAMMING and hasattr(game.programming_language, 'value'):
-            game.current_profile.languages_played.add(game.programming_language.value)
+            game.current_profile.record_language(game.programming_language.value)
 
         # Calculate session time
         session_time = (pygame.time.get_ticks() - game.game_start_time) / 1000 if game.game_start_time > 0 else 0
@@ -183,9 +176,9 @@ def _handle_game_over(game):
             game.achievement_notifications.append((achievement, 300))  # Show for 5 seconds (300 frames)
             game.sound_manager.play('achievement')
 
-        # Save profile
+        # Save profile (written by the settings flush thread)
         game.settings.profiles[game.current_profile.name] = game.current_profile
-        game.settings.save_profiles()
+        game.settings.mark_dirty("profiles")
         game.settings.current_profile = game.current_profile
 
     # Use the stored game mode for high score recording
@@ -4,7 +4,6 @@ Handles keyboard input processing, word typing, and trivia interactions.
 """
 import pygame
 from data.trivia_db import TriviaDatabase
-from core.types import GameMode
 
 
 def handle_input(game, char: str):
@@ -95,7 +94,7 @@ def handle_input(game, char: str):
 
                     # Update profile stats
                     if game.current_profile:
-                        game.current_profile.total_words_typed += 1
+                        game.current_profile.bump('total_words_typed')
                         mode_stats = game.current_profile.get_mode_stats(
                             game.game_mode.value if hasattr(game.game_mode, 'value') else game.game_mode,
                             game.programming_language.value if hasattr(game.programming_language, 'value') else game.programming_language
@@ -105,8 +104,7 @@ def handle_input(game, char: str):
                         if game.current_wpm > mode_stats['best_wpm']:
                             mode_stats['best_wpm'] = game.current_wpm
                         # Also update the overall profile best_wpm
-                        if game.current_wpm > game.current_profile.best_wpm:
-                            game.current_profile.best_wpm = game.current_wpm
+                        game.current_profile.record_best('best_wpm', game.current_wpm)
 
                         # Achievement checking will be handled in main game class
 
@@ -249,14 +247,13 @@ def complete_trivia(game):
     """Complete trivia and award prizes"""
     # Update profile stats
     if game.current_profile:
-        game.current_profile.trivia_questions_answered += 1
+        game.current_profile.bump('trivia_questions_answered')
 
         if game.trivia_result:
             # Correct answer - update stats
-            game.current_profile.trivia_questions_correct += 1
+            game.current_profile.bump('trivia_questions_correct')
             game.current_profile.trivia_streak_current += 1
-            if game.current_profile.trivia_streak_current > game.current_profile.trivia_streak_best:
-                game.current_profile.trivia_streak_best = game.current_profile.trivia_streak_current
+            game.current_profile.record_best('trivia_streak_best', game.current_profile.trivia_streak_current)
 
             # Award one random bonus item
             bonus_item = TriviaDatabase.get_bonus_item()
@@ -265,7 +262,7 @@ def complete_trivia(game):
             game.item_quantities[bonus_item.item_id] += 1
 
             # Track bonus collection
-            game.current_profile.bonus_items_collected += 1
+            game.current_profile.bump('bonus_items_collected')
 
             # Show notification
             game.achievement_notifications.append(
@@ -288,7 +285,4 @@ def complete_trivia(game):
     game.trivia_result = None
 
     # Return to previous game mode
-    if hasattr(game, '_last_game_mode'):
-        game.game_mode = game._last_game_mode
-    else:
-        game.game_mode = GameMode.NORMAL
+    game.game_mode = game._last_game_mode
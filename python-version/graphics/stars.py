@@ -1,8 +1,7 @@
-"""Background starfield entities for P-Type."""
+"""Background starfield for P-Type."""
 from __future__ import annotations
 
-import math
-import random
+import numpy as np
 try:
     import pygame
 except Exception:  # pragma: no cover
@@ -10,42 +9,86 @@ except Exception:  # pragma: no cover
 
 from constants import SCREEN_HEIGHT, SCREEN_WIDTH, TWINKLE_MULTIPLIER
 
+# Sprites are drawn around this offset so the widest shape (size 3 cross) fits
+_SPRITE_HALF = 4
+_SPRITE_SIZE = _SPRITE_HALF * 2 + 1
 
-class ModernStar:
-    """Star used in the animated background."""
 
-    def __init__(self) -> None:
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = random.randint(0, SCREEN_HEIGHT)
-        self.speed = random.uniform(0.3, 2.0)
-        self.brightness = random.randint(100, 255)
-        self.size = random.choice([1, 1, 1, 2, 2, 3])
-        self.twinkle = random.randint(0, 60)
+class StarField:
+    """Animated background stars stored as parallel NumPy arrays.
+
+    Each star is pre-rendered into a small sprite keyed by (size, brightness),
+    so drawing the whole field is a single ``Surface.fblits``/``blits`` call.
+    """
+
+    def __init__(self, count: int = 200) -> None:
+        self.count = count
+        self.x = np.random.randint(0, SCREEN_WIDTH + 1, count)
+        self.y = np.random.randint(0, SCREEN_HEIGHT + 1, count).astype(np.float64)
+        self.speed = np.random.uniform(0.3, 2.0, count)
+        self.brightness = np.random.randint(100, 256, count)
+        self.size = np.random.choice(np.array([1, 1, 1, 2, 2, 3]), count)
+        self.twinkle = np.random.randint(0, 61, count)
+        self._sprites = {}
+        self._blit_sequence = None
 
     def update(self) -> None:
         self.y += self.speed
-        if self.y > SCREEN_HEIGHT:
-            self.y = -10
-            self.x = random.randint(0, SCREEN_WIDTH)
+        wrapped = self.y > SCREEN_HEIGHT
+        if wrapped.any():
+            self.y[wrapped] = -10
+            self.x[wrapped] = np.random.randint(0, SCREEN_WIDTH + 1, int(wrapped.sum()))
         self.twinkle = (self.twinkle + 1) % 120
+        self._blit_sequence = None
 
     def draw(self, screen) -> None:
         if pygame is None:
             return
-        twinkle_factor = 0.7 + 0.3 * math.sin(self.twinkle * TWINKLE_MULTIPLIER)
-        current_brightness = min(255, int(self.brightness * twinkle_factor))
-        color = (current_brightness, current_brightness, min(255, current_brightness + 20))
-
-        if self.size == 1:
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), 1)
-        elif self.size == 2:
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), 2)
-            glow_color = tuple(component // 3 for component in color)
-            pygame.draw.circle(screen, glow_color, (int(self.x), int(self.y)), 3)
+        if self._blit_sequence is None:
+            self._blit_sequence = self._build_blit_sequence()
+        # pygame-ce's fblits skips building the per-blit rect list entirely
+        fblits = getattr(screen, "fblits", None)
+        if fblits is not None:
+            fblits(self._blit_sequence)
         else:
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), 2)
-            pygame.draw.line(screen, color, (self.x - 4, self.y), (self.x + 4, self.y), 1)
-            pygame.draw.line(screen, color, (self.x, self.y - 4), (self.x, self.y + 4), 1)
+            screen.blits(self._blit_sequence, doreturn=False)
+
+    def _build_blit_sequence(self):
+        twinkle_factor = 0.7 + 0.3 * np.sin(self.twinkle * TWINKLE_MULTIPLIER)
+        current = np.minimum(255, (self.brightness * twinkle_factor).astype(np.int64))
+        left = self.x.astype(np.int64) - _SPRITE_HALF
+        top = self.y.astype(np.int64) - _SPRITE_HALF
+        return [
+            (self._sprite(size, level), (x, y))
+            for size, level, x, y in zip(self.size.tolist(), current.tolist(), left.tolist(), top.tolist())
+        ]
+
+    def _sprite(self, size: int, level: int):
+        key = (size, level)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = _render_star(size, level)
+            self._sprites[key] = sprite
+        return sprite
+
+
+def _render_star(size: int, level: int):
+    """Render one star shape exactly as the per-star draw calls would."""
+    sprite = pygame.Surface((_SPRITE_SIZE, _SPRITE_SIZE), pygame.SRCALPHA)
+    color = (level, level, min(255, level + 20))
+    center = (_SPRITE_HALF, _SPRITE_HALF)
+
+    if size == 1:
+        pygame.draw.circle(sprite, color, center, 1)
+    elif size == 2:
+        pygame.draw.circle(sprite, color, center, 2)
+        glow_color = tuple(component // 3 for component in color)
+        pygame.draw.circle(sprite, glow_color, center, 3)
+    else:
+        pygame.draw.circle(sprite, color, center, 2)
+        pygame.draw.line(sprite, color, (0, _SPRITE_HALF), (_SPRITE_SIZE - 1, _SPRITE_HALF), 1)
+        pygame.draw.line(sprite, color, (_SPRITE_HALF, 0), (_SPRITE_HALF, _SPRITE_SIZE - 1), 1)
+    return sprite.convert_alpha()
 
 
-__all__ = ["ModernStar"]
+__all__ = ["StarField"]
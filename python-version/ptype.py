@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import logging
+import sys
+
 from core.environment import configure_environment
 
 
 def main() -> None:
     """Configure the runtime environment and launch the game."""
+    # Debug logging only on request; release builds stay at WARNING
+    verbose = "--verbose" in sys.argv[1:]
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
     configure_environment()
 
     # Import only after configuring the environment so pygame picks up the
@@ -43,21 +43,21 @@ from ui.widgets import ModernButton, ModernDropdown
 
 
 
-def draw_modern_background(game):
+def draw_modern_background(game, surface=None):
     """Draw modern gradient background (responsive to current height)"""
+    target = game.screen if surface is None else surface
     # Create gradient effect using current height
     for i in range(game.current_height):
         ratio = i / game.current_height
         r = int(DARK_BG[0] * (1 - ratio) + DARKER_BG[0] * ratio)
         g = int(DARK_BG[1] * (1 - ratio) + DARKER_BG[1] * ratio)
         b = int(DARK_BG[2] * (1 - ratio) + DARKER_BG[2] * ratio)
-        pygame.draw.line(game.screen, (r, g, b), (0, i), (SCREEN_WIDTH, i))
+        pygame.draw.line(target, (r, g, b), (0, i), (SCREEN_WIDTH, i))
 
 
 def draw_game(game):
     """Render active gameplay including entities and HUD."""
-    for star in game.stars:
-        star.draw(game.screen)
+    game.stars.draw(game.screen)
     game.player_ship.draw(game.screen)
     for enemy in game.enemies:
         enemy.draw(game.screen, game.font)
@@ -497,8 +497,8 @@ def draw_profile_select(game):
     game.screen.blit(overlay, (0, 0))
 
     # Ensure UI elements are configured
-    if (not hasattr(game, 'profile_dropdown') or
-            not hasattr(game, 'profile_panel_rect') or
+    if (game.profile_dropdown is None or
+            game.profile_panel_rect is None or
             game.update_profile_dropdown):
         game.ui_manager.setup_profile_select_ui()
         game.update_profile_dropdown = False
@@ -629,8 +629,7 @@ def draw_about_popup(game):
 def draw_menu_background(game):
     """Draw the menu background with title"""
     # Draw stars
-    for star in game.stars:
-        star.draw(game.screen)
+    game.stars.draw(game.screen)
 
     # Draw the PNG logo image (no fallback)
     if hasattr(game, 'logo_image') and game.logo_image:
@@ -39,6 +39,44 @@ class UIManager:
 
         return window_w, window_h, center_x, std_button_w
 
+    def _selected_mode_has_save(self) -> bool:
+        """Whether the current profile has a saved game for the selected mode"""
+        if not self.game.current_profile or getattr(self.game, 'selected_mode', "Choose a Mode") == "Choose a Mode":
+            return False
+        # Determine if selected mode is Normal or Programming
+        if self.game.selected_mode == "Normal":
+            saved_game = self.game.current_profile.get_saved_game("normal", None)
+        else:
+            # It's a programming language
+            saved_game = self.game.current_profile.get_saved_game("programming", self.game.selected_mode)
+        return saved_game is not None
+
+    def refresh_menu_state(self):
+        """Sync the existing main menu widgets with the selected mode and saves.
+
+        Used when returning to the menu from a game: the layout is unchanged, so
+        only the Continue/New Game state and the dropdown selection are updated
+        instead of rebuilding every widget.
+        """
+        has_save = self._selected_mode_has_save()
+        self.game.continue_button.primary = has_save
+        self.game.continue_button.is_disabled = not has_save
+        self.game.new_game_button.is_disabled = self.game.selected_mode == "Choose a Mode"
+
+        dropdown = self.game.mode_dropdown
+        if self.game.selected_mode in dropdown.options:
+            dropdown.selected_index = dropdown.options.index(self.game.selected_mode)
+        else:
+            self.game.selected_mode = "Choose a Mode"
+            dropdown.selected_index = 0
+
+        # Rebuilt widgets used to start un-hovered; clear state left from the last visit
+        for button in (self.game.continue_button, self.game.new_game_button, self.game.stats_button,
+                       self.game.settings_button, self.game.about_button, self.game.exit_game_button,
+                       self.game.quit_to_menu_button):
+            button.is_hovered = False
+            button.click_animation = 0
+
     def setup_main_menu_ui(self):
         """Setup UI elements for the main menu"""
         window_w, window_h, center_x, std_button_w = self.calculate_responsive_positions()
@@ -48,15 +86,7 @@ class UIManager:
             self.game.selected_mode = "Choose a Mode"
 
         # Check if current profile has a saved game for currently selected mode
-        has_save = False
-        if self.game.current_profile and hasattr(self.game, 'selected_mode') and self.game.selected_mode != "Choose a Mode":
-            # Determine if selected mode is Normal or Programming
-            if self.game.selected_mode == "Normal":
-                saved_game = self.game.current_profile.get_saved_game("normal", None)
-            else:
-                # It's a programming language
-                saved_game = self.game.current_profile.get_saved_game("programming", self.game.selected_mode)
-            has_save = saved_game is not None
+        has_save = self._selected_mode_has_save()
 
         # Continue button - always visible, positioned at top
         continue_y = max(200, int(window_h * 0.22))
@@ -289,6 +319,8 @@ class UIManager:
         if hasattr(self.game, 'player_ship'):
             self.game.player_ship.update_position_for_window_dimensions(self.game.ui_window_width, self.game.current_height)
 
+        self.game._rebuild_button_list()
+
     def setup_ui_elements(self):
         """Setup modern UI elements with fully responsive positioning.
 
@@ -330,15 +362,7 @@ class UIManager:
         continue_y = max(200, int(window_h * 0.22))
 
         # Check if current profile has a saved game for currently selected mode
-        has_save = False
-        if self.game.current_profile and hasattr(self.game, 'selected_mode') and self.game.selected_mode != "Choose a Mode":
-            # Determine if selected mode is Normal or Programming
-            if self.game.selected_mode == "Normal":
-                saved_game = self.game.current_profile.get_saved_game("normal", None)
-            else:
-                # It's a programming language
-                saved_game = self.game.current_profile.get_saved_game("programming", self.game.selected_mode)
-            has_save = saved_game is not None
+        has_save = self._selected_mode_has_save()
 
         # Continue button - always created but may be disabled
         self.game.continue_button = ModernButton(
@@ -370,7 +394,7 @@ class UIManager:
         # Create or update the dropdown with all modes
         # Force the dropdown to show all options properly
         # Preserve open state if dropdown already exists
-        was_open = self.game.mode_dropdown.is_open if hasattr(self.game, 'mode_dropdown') else False
+        was_open = self.game.mode_dropdown.is_open if self.game.mode_dropdown is not None else False
         self.game.mode_dropdown = ModernDropdown(
             center_x - dropdown_w // 2, dropdown_y, dropdown_w, 40,
             all_modes, self.game.font, window_height=window_h
@@ -499,6 +523,8 @@ class UIManager:
             "Main Menu", self.game.medium_font
         )
 
+        self.game._rebuild_button_list()
+
     def recalculate_ui_positions(self):
         """Recalculate UI positions and sizes based on current window dimensions"""
         # Simply call setup again to recalculate everything